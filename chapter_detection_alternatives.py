@@ -12,13 +12,60 @@ Usage:
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from shutil import which
 import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+# Sample rate used for amplitude analysis (mono, 16-bit)
+ANALYSIS_SAMPLE_RATE = 16000
+
+# Books shorter than this skip the hybrid silence pre-pass and go straight to
+# faster-whisper, whose Silero VAD skips silence in the same single pass
+HYBRID_MIN_DURATION_MS = 30 * 60 * 1000
+
+# dBFS voice activity settings for detect_by_whisper(vad='dbfs'); speech is
+# transcribed in batches of about DBFS_BATCH_MS to bound memory use
+DBFS_SILENCE_THRESH = -40
+DBFS_MIN_SILENCE_MS = 500
+DBFS_BATCH_MS = 10 * 60 * 1000
+
+# Minimum number of analysis windows handed to each silence detection worker
+MIN_WINDOWS_PER_WORKER = 10_000
+
+# CTranslate2 compute types accepted by faster-whisper
+COMPUTE_TYPES = ('int8', 'int8_float16', 'float16', 'bfloat16', 'float32')
+
+# Chapter markers and known false positives, matched case-insensitively
+_CHAP_RE = re.compile(r'\b(prologue|epilogue|chapter)\b', re.I)
+_EXCL_RE = re.compile(
+    r'\b(chapter and verse|chapters|this chapter|that chapter|'
+    r'chapter of|in chapter|and chapter|next chapter)\b',
+    re.I
+)
+
+
+@dataclass(slots=True)
+class Chapter:
+    """A detected chapter, with times kept as integer milliseconds."""
+    start_ms: int
+    chapter_type: str
+    end_ms: Optional[int] = None
+
 
 # Method 1: Silence Detection
 def detect_by_silence(audiobook_path: Path,
                      min_silence_len: int = 2000,
-                     silence_thresh: int = -40) -> list[dict]:
+                     silence_thresh: int = -40) -> list[Chapter]:
     """
     Detect chapters by finding long pauses (FASTEST method).
 
@@ -28,53 +75,48 @@ def detect_by_silence(audiobook_path: Path,
     :param audiobook_path: Path to audiobook MP3
     :param min_silence_len: Minimum silence duration in ms (default 2000ms)
     :param silence_thresh: Silence threshold in dBFS (default -40)
-    :return: List of chapter dictionaries
+    :return: List of Chapter objects
     """
     try:
-        from pydub import AudioSegment
-        from pydub.silence import detect_nonsilent
+        import numpy as np
     except ImportError:
         raise ImportError(
-            "pydub is required for silence detection. "
-            "Install with: pip install pydub"
+            "numpy is required for silence detection. "
+            "Install with: pip install numpy"
         )
 
     print(f"[Silence Detection] Loading audio: {audiobook_path.name}")
-    audio = AudioSegment.from_mp3(audiobook_path)
+    samples = _load_pcm_mono16k(audiobook_path)
 
-    print(f"[Silence Detection] Analyzing {len(audio) / 1000 / 60:.1f} minutes of audio...")
+    print(f"[Silence Detection] Analyzing {len(samples) / ANALYSIS_SAMPLE_RATE / 60:.1f} minutes of audio...")
 
     # Detect non-silent ranges (chapters are between silences)
-    nonsilent_ranges = detect_nonsilent(
-        audio,
-        min_silence_len=min_silence_len,
-        silence_thresh=silence_thresh,
-        seek_step=100  # Check every 100ms
+    nonsilent_ranges = _detect_nonsilent_np(
+        samples,
+        ANALYSIS_SAMPLE_RATE,
+        min_silence_ms=min_silence_len,
+        thresh_dbfs=silence_thresh,
+        step_ms=100  # Check every 100ms
     )
 
     print(f"[Silence Detection] Found {len(nonsilent_ranges)} potential chapters")
 
-    # Convert to chapter format
-    chapters = []
-    for i, (start_ms, end_ms) in enumerate(nonsilent_ranges, start=1):
-        chapters.append({
-            'start': _ms_to_timestamp(start_ms),
-            'end': _ms_to_timestamp(end_ms),
-            'chapter_type': f'Chapter {i:02d}'
-        })
-
-    # Remove the end from the last chapter
-    if chapters:
-        chapters[-1].pop('end', None)
-
-    return chapters
+    # Convert to chapter format, leaving the end off the last chapter
+    last = len(nonsilent_ranges)
+    return [
+        Chapter(start_ms, f'Chapter {i:02d}', end_ms if i != last else None)
+        for i, (start_ms, end_ms) in enumerate(nonsilent_ranges, start=1)
+    ]
 
 
 # Method 2: faster-whisper (Recommended)
 def detect_by_whisper(audiobook_path: Path,
                      model_size: str = "base",
                      device: str = "cpu",
-                     language: str = "en") -> list[dict]:
+                     language: str = "en",
+                     compute_type: Optional[str] = None,
+                     beam_size: int = 1,
+                     vad: str = "silero") -> list[Chapter]:
     """
     Detect chapters using faster-whisper (RECOMMENDED method).
 
@@ -85,7 +127,10 @@ def detect_by_whisper(audiobook_path: Path,
     :param model_size: Model size - tiny, base, small, medium, large-v2
     :param device: "cpu" or "cuda" for GPU acceleration
     :param language: Language code (en, es, fr, de, etc.)
-    :return: List of chapter dictionaries
+    :param compute_type: CTranslate2 compute type (default: int8_float16 on CUDA, int8 on CPU)
+    :param beam_size: Decoder beam width (default 1, greedy - enough for keyword spotting)
+    :param vad: "silero" (faster-whisper's neural VAD) or "dbfs" (amplitude threshold, cheaper)
+    :return: List of Chapter objects
     """
     try:
         from faster_whisper import WhisperModel
@@ -109,9 +154,17 @@ def detect_by_whisper(audiobook_path: Path,
                 print("[faster-whisper] TIP: Use the main script for instant extraction:")
                 print(f"  python chapterize_ab.py \"{audiobook_path}\"")
 
-                choice = input("\nUse existing chapters? [Y/n]: ").strip().lower()
+                # Don't prompt when stdin is piped (e.g. --batch); use existing chapters
+                if sys.stdin.isatty():
+                    choice = input("\nUse existing chapters? [Y/n]: ").strip().lower()
+                else:
+                    choice = 'y'
                 if choice != 'n':
-                    return existing_chapters
+                    return [
+                        Chapter(_timestamp_to_ms(ch['start']), ch['chapter_type'],
+                                _timestamp_to_ms(ch['end']) if 'end' in ch else None)
+                        for ch in existing_chapters
+                    ]
                 else:
                     print("[faster-whisper] Continuing with ML detection...")
         except (ImportError, Exception) as e:
@@ -119,77 +172,78 @@ def detect_by_whisper(audiobook_path: Path,
             print("[faster-whisper] Proceeding with transcription...")
 
     print(f"\n[faster-whisper] Loading model: {model_size}")
-    model = WhisperModel(
-        model_size,
-        device=device,
-        compute_type="int8"  # Faster inference
-    )
+    model = _load_whisper_model(model_size, device, compute_type)
 
     print(f"[faster-whisper] Transcribing: {audiobook_path.name}")
 
-    # Check file size to determine if we should use VAD
-    # VAD can crash on very large files due to memory usage
-    file_size_mb = audiobook_path.stat().st_size / (1024 * 1024)
-    use_vad = file_size_mb < 500  # Only use VAD for files < 500MB
-
-    if use_vad:
-        print("[faster-whisper] Using Voice Activity Detection to skip silence...")
-    else:
-        print(f"[faster-whisper] Large file ({file_size_mb:.0f}MB) - VAD disabled to prevent memory issues")
-
-    print("[faster-whisper] This may take a while - processing audio...")
-    print("[faster-whisper] Note: Progress updates will appear as segments are processed\n")
-
-    segments, info = model.transcribe(
-        str(audiobook_path),
+    # Greedy decoding is plenty for spotting common words like "chapter"; not
+    # conditioning on previous text avoids hallucination loops on long books
+    decode_options = dict(
         language=language,
-        beam_size=5,
-        vad_filter=use_vad,
-        vad_parameters=dict(min_silence_duration_ms=500) if use_vad else None
+        beam_size=beam_size,
+        best_of=1,
+        temperature=[0.0, 0.2, 0.4],
+        condition_on_previous_text=False,
+        without_timestamps=False,
+        word_timestamps=False
     )
 
-    print(f"\n[faster-whisper] Detected language: {info.language} "
-          f"(probability: {info.language_probability:.2f})")
+    # Only set by the full-file path; read after the segments are consumed
+    info = None
 
-    # Extract chapter markers
-    chapters = []
-    chapter_keywords = ['prologue', 'chapter', 'epilogue']
-    excluded_phrases = [
-        'chapter and verse', 'chapters', 'this chapter', 'that chapter',
-        'chapter of', 'in chapter', 'and chapter', 'next chapter'
-    ]
+    if vad == "dbfs":
+        print("[faster-whisper] Using dBFS silence detection to skip silence...")
+        print("[faster-whisper] This may take a while - processing audio...")
+        print("[faster-whisper] Note: Progress updates will appear as segments are processed\n")
+
+        segments = _transcribe_speech_spans(model, audiobook_path, **decode_options)
+    else:
+        # Check file size to determine if we should use VAD
+        # VAD can crash on very large files due to memory usage
+        file_size_mb = audiobook_path.stat().st_size / (1024 * 1024)
+        use_vad = file_size_mb < 500  # Only use VAD for files < 500MB
+
+        if use_vad:
+            print("[faster-whisper] Using Voice Activity Detection to skip silence...")
+        else:
+            print(f"[faster-whisper] Large file ({file_size_mb:.0f}MB) - VAD disabled to prevent memory issues")
+
+        print("[faster-whisper] This may take a while - processing audio...")
+        print("[faster-whisper] Note: Progress updates will appear as segments are processed\n")
+
+        segments, info = model.transcribe(
+            str(audiobook_path),
+            vad_filter=use_vad,
+            vad_parameters=dict(min_silence_duration_ms=500) if use_vad else None,
+            **decode_options
+        )
+
+    # Segments are decoded lazily as the loop pulls them; only the
+    # (start_ms, chapter_type) pairs of matching segments are kept
+    markers = []
 
     counter = 1
     for segment in segments:
-        text = segment.text.strip()
-        text_lower = text.lower()
+        # Check if this segment mentions a chapter marker, excluding false positives
+        match = _CHAP_RE.search(segment.text)
+        if not match or _EXCL_RE.search(segment.text):
+            continue
 
-        # Check if this segment mentions a chapter marker
-        if any(keyword in text_lower for keyword in chapter_keywords):
-            # Exclude false positives
-            if any(excluded in text_lower for excluded in excluded_phrases):
-                continue
+        # Determine chapter type
+        keyword = match.group(1).lower()
+        if keyword == 'chapter':
+            chapter_type = f'Chapter {counter:02d}'
+            counter += 1
+        else:
+            chapter_type = keyword.title()
 
-            # Determine chapter type
-            if 'prologue' in text_lower:
-                chapter_type = 'Prologue'
-            elif 'epilogue' in text_lower:
-                chapter_type = 'Epilogue'
-            elif 'chapter' in text_lower:
-                chapter_type = f'Chapter {counter:02d}'
-                counter += 1
-            else:
-                chapter_type = text.title()
-
-            chapters.append({
-                'start': _seconds_to_timestamp(segment.start),
-                'chapter_type': chapter_type
-            })
-
-    # Add end times (start of next chapter - 1 second)
-    for i in range(len(chapters) - 1):
-        next_start = chapters[i + 1]['start']
-        chapters[i]['end'] = _subtract_one_second(next_start)
+        markers.append((int(segment.start * 1000), chapter_type))
+
+    if info is not None:
+        print(f"\n[faster-whisper] Detected language: {info.language} "
+              f"(probability: {info.language_probability:.2f})")
+
+    chapters = _chapters_from_markers(markers)
 
     print(f"[faster-whisper] Found {len(chapters)} chapters")
     return chapters
@@ -199,13 +253,19 @@ def detect_by_whisper(audiobook_path: Path,
 def detect_hybrid(audiobook_path: Path,
                  model_size: str = "tiny",
                  silence_len: int = 1500,
-                 silence_thresh: int = -40) -> list[dict]:
+                 silence_thresh: int = -40,
+                 device: str = "cpu",
+                 compute_type: Optional[str] = None,
+                 marker_min_ms: int = 300,
+                 marker_max_ms: int = 3000,
+                 force_hybrid: bool = False) -> list[Chapter]:
     """
     Hybrid approach: Silence detection + selective transcription (SMARTEST method).
 
     1. Find long silences (potential chapter boundaries)
-    2. Transcribe only 30 seconds around each silence
-    3. Confirm if it's a chapter marker
+    2. Keep silences followed by a short burst of speech (a spoken chapter title)
+    3. Transcribe only 30 seconds around each remaining silence
+    4. Confirm if it's a chapter marker
 
     Only transcribes ~5-10% of audiobook - much faster!
 
@@ -213,85 +273,502 @@ def detect_hybrid(audiobook_path: Path,
     :param model_size: Whisper model size (use tiny for speed)
     :param silence_len: Minimum silence length in ms
     :param silence_thresh: Silence threshold in dBFS
-    :return: List of chapter dictionaries
+    :param device: "cpu" or "cuda" for GPU acceleration
+    :param compute_type: CTranslate2 compute type (default: int8_float16 on CUDA, int8 on CPU)
+    :param marker_min_ms: Shortest speech span after a silence worth transcribing
+    :param marker_max_ms: Longest speech span after a silence worth transcribing
+    :param force_hybrid: Use the hybrid method even for books under 30 minutes
+    :return: List of Chapter objects
     """
     try:
-        from pydub import AudioSegment
-        from pydub.silence import detect_silence
+        import numpy as np
         from faster_whisper import WhisperModel
     except ImportError as e:
         raise ImportError(
             f"Missing dependency: {e}\n"
-            "Install with: pip install pydub faster-whisper"
+            "Install with: pip install numpy faster-whisper"
         )
 
+    # Short books: a single VAD-filtered whisper pass beats the silence pre-pass, so
+    # check the length with ffprobe before decoding anything
+    duration_ms = None if force_hybrid else _probe_duration_ms(audiobook_path)
+    if duration_ms is not None and duration_ms < HYBRID_MIN_DURATION_MS:
+        print(f"[Hybrid] Audio is under {HYBRID_MIN_DURATION_MS // 60000} minutes - "
+              "using faster-whisper with VAD instead")
+        return detect_by_whisper(audiobook_path, model_size=model_size,
+                                 device=device, compute_type=compute_type)
+
     print(f"[Hybrid] Step 1/3: Detecting silence...")
-    audio = AudioSegment.from_mp3(audiobook_path)
+    # Whisper model size to fall back to; transcription runs after the mapping is released
+    fallback_model = None
+    with _mapped_pcm(audiobook_path) as samples:
+        samples_per_ms = ANALYSIS_SAMPLE_RATE // 1000
+        total_ms = len(samples) // samples_per_ms
+
+        if duration_ms is None and total_ms < HYBRID_MIN_DURATION_MS and not force_hybrid:
+            # ffprobe couldn't tell us the length up front
+            print(f"[Hybrid] Audio is under {HYBRID_MIN_DURATION_MS // 60000} minutes - "
+                  "using faster-whisper with VAD instead")
+            fallback_model = model_size
+            silences = []
+        else:
+            silences = _detect_silence_np(
+                samples,
+                ANALYSIS_SAMPLE_RATE,
+                min_silence_ms=silence_len,
+                thresh_dbfs=silence_thresh,
+                step_ms=100
+            )
+
+            print(f"[Hybrid] Found {len(silences)} potential chapter boundaries")
+
+            if not silences:
+                print("[Hybrid] No silences found - falling back to full transcription")
+                fallback_model = "tiny"
+
+        if silences:
+            # The speech following each silence runs until the next silence starts.
+            # Chapter titles are short phrases; long spans are narration, tiny ones noise.
+            next_starts = [start for start, _ in silences[1:]] + [total_ms]
+            candidates = [
+                (silence_start, silence_end)
+                for (silence_start, silence_end), next_start in zip(silences, next_starts)
+                if marker_min_ms <= next_start - silence_end <= marker_max_ms
+            ]
+
+            skipped = len(silences) - len(candidates)
+            print(f"[Hybrid] Skipped {skipped} candidates not followed by "
+                  f"{marker_min_ms}-{marker_max_ms}ms of speech")
+
+            if not candidates:
+                print("[Hybrid] No candidates left after filtering - transcribing around every silence")
+                candidates = silences
+
+            # Extract 30 seconds around each silence (15s before, 15s after) and
+            # concatenate the windows so the model is only invoked once
+            windows = [
+                (max(0, silence_start - 15000), min(total_ms, silence_end + 15000))
+                for silence_start, silence_end in candidates
+            ]
+            candidate_audio, clip_offsets_ms = _concat_spans(samples, windows)
+
+    if fallback_model is not None:
+        return detect_by_whisper(audiobook_path, model_size=fallback_model,
+                                 device=device, compute_type=compute_type)
+
+    print(f"[Hybrid] Step 2/3: Loading Whisper model ({model_size})...")
+    model = _load_whisper_model(model_size, device, compute_type)
+
+    print("[Hybrid] Step 3/3: Selectively transcribing around silence points...")
+
+    markers = []
 
-    silences = detect_silence(
-        audio,
-        min_silence_len=silence_len,
-        silence_thresh=silence_thresh,
-        seek_step=100
+    segments, _ = model.transcribe(
+        candidate_audio,
+        language="en",
+        vad_filter=True,
+        condition_on_previous_text=False
     )
 
-    print(f"[Hybrid] Found {len(silences)} potential chapter boundaries")
+    # Keep the first chapter marker found in each candidate window
+    matched_windows = set()
+    for seg in segments:
+        # Case-insensitive regex on the raw text: no lower()/strip() copies, and
+        # most segments are rejected before the window lookup
+        if not _CHAP_RE.search(seg.text):
+            continue
 
-    if not silences:
-        print("[Hybrid] No silences found - falling back to full transcription")
-        return detect_by_whisper(audiobook_path, model_size="tiny")
+        seg_ms = seg.start * 1000
+        idx = bisect_right(clip_offsets_ms, seg_ms) - 1
+        if idx < 0 or idx in matched_windows:
+            continue
 
-    print(f"[Hybrid] Step 2/3: Loading Whisper model ({model_size})...")
-    model = WhisperModel(model_size, device="cpu", compute_type="int8")
+        # Calculate absolute timestamp
+        absolute_time_ms = windows[idx][0] + (seg_ms - clip_offsets_ms[idx])
 
-    print("[Hybrid] Step 3/3: Selectively transcribing around silence points...")
+        markers.append((int(absolute_time_ms), seg.text.strip().title()))
+        matched_windows.add(idx)
+        print(f"  ✓ Found chapter at {_ms_to_timestamp(candidates[idx][0])}")
+
+    chapters = _chapters_from_markers(markers)
 
-    chapters = []
-    chapter_keywords = ['prologue', 'chapter', 'epilogue']
-    temp_segment = Path("/tmp/temp_segment.mp3")
+    print(f"[Hybrid] Found {len(chapters)} chapters")
+    return chapters
 
-    for idx, (silence_start, silence_end) in enumerate(silences):
-        # Extract 30 seconds around silence (15s before, 15s after)
-        start = max(0, silence_start - 15000)
-        end = min(len(audio), silence_end + 15000)
 
-        segment = audio[start:end]
-        segment.export(temp_segment, format="mp3")
+# Utility functions
+class _TimedText(NamedTuple):
+    """A transcribed segment with its start time (seconds) in the full book."""
+    start: float
+    text: str
 
-        # Transcribe this small segment
-        segments, _ = model.transcribe(str(temp_segment), language="en")
 
-        # Check if it contains a chapter marker
-        found_chapter = False
-        for seg in segments:
-            text = seg.text.lower().strip()
-            if any(keyword in text for keyword in chapter_keywords):
-                # Calculate absolute timestamp
-                absolute_time_ms = start + (seg.start * 1000)
+def _concat_spans(samples, spans: list[tuple[int, int]]):
+    """
+    Concatenate (start_ms, end_ms) spans of PCM into one float32 buffer.
 
-                chapters.append({
-                    'start': _ms_to_timestamp(int(absolute_time_ms)),
-                    'chapter_type': seg.text.strip().title()
-                })
-                found_chapter = True
-                break
+    A second of silence separates the spans. The returned offset table gives
+    where each span begins in the buffer, so a timestamp in the buffer can be
+    mapped back to the book with ``bisect_right``.
 
-        if found_chapter:
-            print(f"  ✓ Found chapter at {_ms_to_timestamp(silence_start)}")
+    :param samples: 1-D ``np.int16`` array of samples at ``ANALYSIS_SAMPLE_RATE``
+    :param spans: Ranges to extract, in ms
+    :return: Float32 buffer in [-1, 1) and the buffer offset of each span in ms
+    """
+    import numpy as np
 
-    # Clean up
-    if temp_segment.exists():
-        temp_segment.unlink()
+    samples_per_ms = ANALYSIS_SAMPLE_RATE // 1000
+    separator = np.zeros(ANALYSIS_SAMPLE_RATE, dtype=np.float32)
+    clips = []
+    offsets_ms = []
+    offset_ms = 0.0
 
-    # Add end times
-    for i in range(len(chapters) - 1):
-        chapters[i]['end'] = _subtract_one_second(chapters[i + 1]['start'])
+    for start_ms, end_ms in spans:
+        # Converted per span to keep memory bounded
+        clip = samples[start_ms * samples_per_ms:end_ms * samples_per_ms].astype(np.float32) / 32768.0
+        clips.extend((clip, separator))
+        offsets_ms.append(offset_ms)
+        offset_ms += (len(clip) + len(separator)) / samples_per_ms
 
-    print(f"[Hybrid] Found {len(chapters)} chapters")
-    return chapters
+    return np.concatenate(clips), offsets_ms
+
+
+def _transcribe_speech_spans(model, audiobook_path: Path, **decode_options):
+    """
+    Transcribe only the speech found by dBFS thresholding.
+
+    A cheap alternative to faster-whisper's Silero VAD for studio audiobook
+    audio, where silence really is silent. Speech spans are concatenated into
+    batches of about ``DBFS_BATCH_MS`` and transcribed with ``vad_filter=False``.
+
+    :param model: Loaded WhisperModel
+    :param audiobook_path: Path to audiobook file
+    :param decode_options: Extra keyword arguments for ``model.transcribe``
+    :return: Generator of segments with start times relative to the full book
+    """
+    with _mapped_pcm(audiobook_path) as samples:
+        spans = _detect_nonsilent_np(
+            samples,
+            ANALYSIS_SAMPLE_RATE,
+            min_silence_ms=DBFS_MIN_SILENCE_MS,
+            thresh_dbfs=DBFS_SILENCE_THRESH
+        )
+
+        batch = []
+        batch_ms = 0
+        for i, (start_ms, end_ms) in enumerate(spans):
+            batch.append((start_ms, end_ms))
+            batch_ms += end_ms - start_ms
+            if batch_ms < DBFS_BATCH_MS and i != len(spans) - 1:
+                continue
+
+            audio, offsets_ms = _concat_spans(samples, batch)
+            segments, _ = model.transcribe(audio, vad_filter=False, **decode_options)
+            for seg in segments:
+                seg_ms = seg.start * 1000
+                idx = max(0, bisect_right(offsets_ms, seg_ms) - 1)
+                yield _TimedText(start=(batch[idx][0] + seg_ms - offsets_ms[idx]) / 1000, text=seg.text)
+
+            batch = []
+            batch_ms = 0
+
+
+def _probe_duration_ms(audiobook_path: Path) -> Optional[int]:
+    """
+    Read an audiobook's duration from its container with ffprobe, without decoding.
+
+    :param audiobook_path: Path to audiobook file
+    :return: Duration in milliseconds, or None if ffprobe is unavailable or can't tell
+    """
+    if which('ffprobe') is None:
+        return None
+
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+         '-of', 'default=noprint_wrappers=1:nokey=1', str(audiobook_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        return int(float(result.stdout) * 1000)
+    except ValueError:
+        return None
+
+
+def _require_ffmpeg() -> None:
+    """
+    Make sure ffmpeg is available, since every detection method decodes audio with it.
+
+    :raises RuntimeError: If ffmpeg is not on the PATH
+    """
+    if which('ffmpeg') is None:
+        raise RuntimeError(
+            "ffmpeg is required to decode audio for chapter detection, but it was not "
+            "found on the PATH. Install ffmpeg and try again"
+        )
+
+
+@contextmanager
+def _mapped_pcm(audiobook_path: Path):
+    """
+    Provide 16 kHz mono PCM samples backed by a memory-mapped temp file.
+
+    Slices of the mapping are zero-copy views that the OS pages in on demand,
+    so long books don't have to stay resident in RAM.
+
+    :param audiobook_path: Path to audiobook file
+    :return: Context manager yielding a 1-D ``np.int16`` array
+    :raises RuntimeError: If ffmpeg is not on the PATH or fails to decode the file
+    """
+    import numpy as np
+
+    pcm_file, n_samples = _decode_to_tempfile(audiobook_path)
+    try:
+        if n_samples:
+            yield np.memmap(pcm_file, dtype=np.int16, mode='r', shape=(n_samples,))
+        else:
+            yield np.empty(0, dtype=np.int16)
+    finally:
+        try:
+            pcm_file.unlink(missing_ok=True)
+        except OSError:
+            # Windows refuses to delete a file that is still mapped
+            pass
+
+
+def _decode_to_tempfile(audiobook_path: Path) -> tuple[Path, int]:
+    """
+    Decode an audiobook to a raw 16 kHz mono s16le temp file with ffmpeg.
+
+    :param audiobook_path: Path to audiobook file
+    :return: Path to the temp file and the number of samples it holds
+    :raises RuntimeError: If ffmpeg is not on the PATH or fails to decode the file
+    """
+    _require_ffmpeg()
+
+    with tempfile.NamedTemporaryFile(prefix='chapz_', suffix='.s16le', delete=False) as tmp:
+        pcm_file = Path(tmp.name)
+
+    result = subprocess.run(
+        ['ffmpeg', '-y', '-loglevel', 'error', '-i', str(audiobook_path),
+         '-f', 's16le', '-ac', '1', '-ar', str(ANALYSIS_SAMPLE_RATE), str(pcm_file)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        pcm_file.unlink(missing_ok=True)
+        raise RuntimeError(
+            f"ffmpeg failed to decode {audiobook_path.name}: "
+            f"{result.stderr.decode('utf-8', errors='ignore')[:200]}"
+        )
+
+    return pcm_file, pcm_file.stat().st_size // 2
+
+
+def _load_pcm_mono16k(audiobook_path: Path):
+    """
+    Decode an audiobook to 16 kHz mono 16-bit PCM samples.
+
+    ffmpeg streams raw s16le to a pipe, which skips a temporary WAV file.
+
+    :param audiobook_path: Path to audiobook file
+    :return: 1-D ``np.int16`` array of samples at ``ANALYSIS_SAMPLE_RATE``
+    :raises RuntimeError: If ffmpeg is not on the PATH or fails to decode the file
+    """
+    import numpy as np
+
+    _require_ffmpeg()
+
+    result = subprocess.run(
+        ['ffmpeg', '-loglevel', 'error', '-i', str(audiobook_path),
+         '-f', 's16le', '-ac', '1', '-ar', str(ANALYSIS_SAMPLE_RATE), '-'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed to decode {audiobook_path.name}: "
+            f"{result.stderr.decode('utf-8', errors='ignore')[:200]}"
+        )
+
+    return np.frombuffer(result.stdout, dtype=np.int16)
+
+
+@lru_cache(maxsize=4)
+def _load_whisper_model(model_size: str, device: str, compute_type: Optional[str]):
+    """
+    Construct a faster-whisper model with a compute type suited to the device.
+
+    CUDA defaults to int8_float16 (INT8 weights, FP16 activations), which uses
+    roughly half the VRAM of float16 and runs faster. CPU defaults to int8 and
+    spreads the GEMMs over every core. Loaded models are cached, so repeated
+    detections in one process (see ``--batch``) skip the weight load.
+
+    :param model_size: Model size - tiny, base, small, medium, large-v2
+    :param device: "cpu" or "cuda"
+    :param compute_type: Explicit compute type, or None to pick per device
+    :return: A loaded WhisperModel
+    """
+    from faster_whisper import WhisperModel
+
+    if compute_type is None:
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=os.cpu_count() or 0,
+        num_workers=1
+    )
+
+
+@lru_cache(maxsize=1)
+def _numba_energy_kernel():
+    """Return a Numba-compiled mean energy kernel, or None if Numba is not installed.
+
+    Numba is imported here rather than at module level, so runs that never use the
+    silence detectors don't pay for importing it.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    def energy_kernel(samples, win, out):
+        """Fill ``out`` with the mean energy per window."""
+        for i in prange(len(out)):
+            acc = 0
+            for j in range(i * win, (i + 1) * win):
+                v = int(samples[j])
+                acc += v * v
+            out[i] = acc / win
+
+    return njit(parallel=True, cache=True, fastmath=True)(energy_kernel)
+
+
+def _window_energy(samples, win: int):
+    """
+    Compute the mean energy of every complete ``win``-sample window.
+
+    Uses the Numba kernel when Numba is installed, which vectorizes the
+    squared-sample accumulator and spreads windows over all cores with
+    ``prange``. Otherwise large buffers are split into window-aligned chunks
+    and processed on a thread pool. NumPy releases the GIL for the arithmetic,
+    so this scales across cores without copying the samples to other
+    processes, and no stitching is needed because no window straddles a
+    chunk boundary.
+
+    :param samples: 1-D ``np.int16`` array of mono samples
+    :param win: Window size in samples
+    :return: 1-D float array with one energy value per window
+    """
+    import numpy as np
+
+    n_windows = len(samples) // win
+
+    if (kernel := _numba_energy_kernel()) is not None:
+        out = np.empty(n_windows, dtype=np.float64)
+        kernel(np.asarray(samples), win, out)
+        return out
+
+    def chunk_energy(lo: int, hi: int):
+        frames = samples[lo * win:hi * win].reshape(-1, win).astype(np.int32)
+        return (frames * frames).mean(axis=1)
+
+    workers = min(os.cpu_count() or 1, n_windows // MIN_WINDOWS_PER_WORKER)
+    if workers <= 1:
+        return chunk_energy(0, n_windows)
+
+    bounds = np.linspace(0, n_windows, workers + 1, dtype=int)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(chunk_energy, bounds[:-1], bounds[1:]))
+
+    return np.concatenate(parts)
+
+
+def _detect_silence_np(samples,
+                       sr: int,
+                       min_silence_ms: int,
+                       thresh_dbfs: float,
+                       step_ms: int = 100) -> list[tuple[int, int]]:
+    """
+    Find silent ranges in 16-bit mono PCM samples using block RMS.
+
+    Vectorized replacement for pydub's ``detect_silence``. The signal is cut
+    into fixed ``step_ms`` windows, and runs of quiet windows lasting at least
+    ``min_silence_ms`` are reported.
+
+    :param samples: 1-D ``np.int16`` array of mono samples
+    :param sr: Sample rate of ``samples`` in Hz
+    :param min_silence_ms: Minimum silence duration in ms
+    :param thresh_dbfs: Silence threshold in dBFS
+    :param step_ms: Analysis window size in ms
+    :return: List of (start_ms, end_ms) silent ranges
+    """
+    import numpy as np
+
+    total_ms = len(samples) * 1000 // sr
+    win = sr * step_ms // 1000
+    n_windows = len(samples) // win
+    if total_ms < min_silence_ms or n_windows == 0:
+        return []
+
+    # Mean energy per window, compared against the squared amplitude threshold
+    energy = _window_energy(samples, win)
+    thresh_energy = 10 ** (thresh_dbfs / 10) * 32768 ** 2
+    silent = energy <= thresh_energy
+
+    # Run-length encode the mask; pad so every run has an edge on both sides
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], silent.astype(np.int8), [0]))))
+    starts, ends = edges[::2], edges[1::2]
+
+    min_windows = -(-min_silence_ms // step_ms)
+    keep = (ends - starts) >= min_windows
+
+    return [
+        (int(start) * step_ms, min(int(end) * step_ms, total_ms))
+        for start, end in zip(starts[keep], ends[keep])
+    ]
+
+
+def _detect_nonsilent_np(samples,
+                         sr: int,
+                         min_silence_ms: int,
+                         thresh_dbfs: float,
+                         step_ms: int = 100) -> list[tuple[int, int]]:
+    """
+    Find non-silent ranges in 16-bit mono PCM samples.
+
+    Inverse of ``_detect_silence_np``, matching pydub's ``detect_nonsilent``.
+
+    :param samples: 1-D ``np.int16`` array of mono samples
+    :param sr: Sample rate of ``samples`` in Hz
+    :param min_silence_ms: Minimum silence duration in ms
+    :param thresh_dbfs: Silence threshold in dBFS
+    :param step_ms: Analysis window size in ms
+    :return: List of (start_ms, end_ms) non-silent ranges
+    """
+    total_ms = len(samples) * 1000 // sr
+    silent_ranges = _detect_silence_np(samples, sr, min_silence_ms, thresh_dbfs, step_ms)
+
+    # If there is no silence, the whole thing is non-silent
+    if not silent_ranges:
+        return [(0, total_ms)]
+
+    nonsilent_ranges = []
+    prev_end = 0
+    for start, end in silent_ranges:
+        if start > prev_end:
+            nonsilent_ranges.append((prev_end, start))
+        prev_end = end
+
+    if prev_end < total_ms:
+        nonsilent_ranges.append((prev_end, total_ms))
+
+    return nonsilent_ranges
 
 
-# Utility functions
 def _ms_to_timestamp(ms: int) -> str:
     """Convert milliseconds to HH:MM:SS.mmm format."""
     seconds = ms // 1000
@@ -302,31 +779,71 @@ def _ms_to_timestamp(ms: int) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
 
 
-def _seconds_to_timestamp(seconds: float) -> str:
-    """Convert seconds to HH:MM:SS.mmm format."""
-    return _ms_to_timestamp(int(seconds * 1000))
+def _ms_to_timestamp_array(ms) -> list[str]:
+    """
+    Convert an array of milliseconds to HH:MM:SS.mmm strings in one pass.
 
+    The divmods run over the whole array in NumPy, leaving only the string
+    assembly per element.
 
-def _subtract_one_second(timestamp: str) -> str:
-    """Subtract one second from timestamp for end markers."""
-    parts = timestamp.split(':')
-    last_part = parts[-1]
-    secs, ms = last_part.split('.')
+    :param ms: Integer array of millisecond offsets
+    :return: List of formatted timestamps
+    """
+    import numpy as np
+
+    hours, rem = np.divmod(np.asarray(ms, dtype=np.int64), 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    secs, millis = np.divmod(rem, 1000)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}.{msr:03d}"
+        for h, m, s, msr in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+    ]
 
-    total_seconds = (
-        int(parts[0]) * 3600 +
-        int(parts[1]) * 60 +
-        int(secs) - 1
-    )
 
-    if total_seconds < 0:
-        total_seconds = 0
+def _timestamp_to_ms(timestamp: str) -> int:
+    """Convert HH:MM:SS.mmm timestamp to milliseconds."""
+    hours, minutes, seconds = timestamp.split(':')
+    return (int(hours) * 3600 + int(minutes) * 60) * 1000 + round(float(seconds) * 1000)
 
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
 
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms}"
+def _chapters_from_markers(markers: list[tuple[int, str]]) -> list[Chapter]:
+    """
+    Build chapters from (start_ms, chapter_type) pairs.
+
+    Each chapter ends one second before the next one starts, and the last
+    chapter runs to the end of the file.
+
+    :param markers: Chapter start times in ms with their chapter type
+    :return: List of Chapter objects
+    """
+    chapters = [Chapter(start_ms, chapter_type) for start_ms, chapter_type in markers]
+    for chapter, next_chapter in zip(chapters, chapters[1:]):
+        chapter.end_ms = max(0, next_chapter.start_ms - 1000)
+
+    return chapters
+
+
+def chapters_to_timecodes(chapters: list[Chapter]) -> list[dict]:
+    """
+    Convert chapters to the timecode dictionaries used by chapterize_ab.py.
+
+    All timestamps are formatted in one vectorized pass. The last chapter
+    usually has no end and runs to the end of the file.
+
+    :param chapters: List of Chapter objects
+    :return: List of dicts with 'start', 'chapter_type' and optional 'end' keys
+    """
+    starts = _ms_to_timestamp_array([chapter.start_ms for chapter in chapters])
+    ends = _ms_to_timestamp_array([chapter.end_ms or 0 for chapter in chapters])
+
+    timecodes = []
+    for chapter, start, end in zip(chapters, starts, ends):
+        timecode = {'start': start, 'chapter_type': chapter.chapter_type}
+        if chapter.end_ms is not None:
+            timecode['end'] = end
+        timecodes.append(timecode)
+
+    return timecodes
 
 
 # CLI Interface
@@ -335,7 +852,8 @@ def main():
     parser = argparse.ArgumentParser(
         description="Alternative chapter detection methods for audiobooks"
     )
-    parser.add_argument('audiobook', type=Path, help='Path to audiobook MP3 file')
+    parser.add_argument('audiobook', type=Path, nargs='?',
+                        help='Path to audiobook MP3 file (omit when using --batch)')
     parser.add_argument(
         '--method',
         choices=['silence', 'whisper', 'hybrid'],
@@ -348,52 +866,115 @@ def main():
         choices=['tiny', 'base', 'small', 'medium', 'large-v2'],
         help='Whisper model size (default: base)'
     )
+    parser.add_argument(
+        '--device',
+        default='cpu',
+        choices=['cpu', 'cuda'],
+        help='Device for Whisper inference (default: cpu)'
+    )
+    parser.add_argument(
+        '--compute-type',
+        dest='compute_type',
+        default=None,
+        choices=COMPUTE_TYPES,
+        help='Whisper compute type (default: int8_float16 on cuda, int8 on cpu)'
+    )
+    parser.add_argument(
+        '--beam-size',
+        dest='beam_size',
+        type=int,
+        default=1,
+        help='Whisper decoder beam width; raise for better recall (default: 1)'
+    )
     parser.add_argument(
         '--output',
         type=Path,
         help='Output file for chapter list (default: print to console)'
     )
+    parser.add_argument(
+        '--vad',
+        default='silero',
+        choices=['silero', 'dbfs'],
+        help='How the whisper method skips silence: silero (neural VAD) or dbfs (cheaper amplitude threshold)'
+    )
+    parser.add_argument(
+        '--force-hybrid',
+        dest='force_hybrid',
+        action='store_true',
+        help='Use the hybrid method even for books under 30 minutes'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Read audiobook paths from stdin, one per line, reusing the loaded model'
+    )
 
     args = parser.parse_args()
 
-    if not args.audiobook.exists():
-        print("\n" + "="*60)
-        print("ERROR: File not found")
-        print("="*60)
-        print(f"\nFile: {args.audiobook}")
-        print("\nPlease check:")
-        print("  - The file path is correct")
-        print("  - The file exists at the specified location")
-        print("  - You have permission to access the file")
-        print("\nSupported formats: .mp3, .m4b, .m4a")
-        print("\nExample usage:")
-        print(f"  python {Path(__file__).name} audiobook.mp3 --method whisper")
-        print("="*60 + "\n")
-        return 1
-
-    # Detect chapters using selected method
-    if args.method == 'silence':
-        chapters = detect_by_silence(args.audiobook)
-    elif args.method == 'whisper':
-        chapters = detect_by_whisper(args.audiobook, model_size=args.model_size)
-    elif args.method == 'hybrid':
-        chapters = detect_hybrid(args.audiobook, model_size=args.model_size)
-
-    # Output results
+    if args.batch:
+        audiobooks = [Path(line.strip()) for line in sys.stdin if line.strip()]
+    elif args.audiobook:
+        audiobooks = [args.audiobook]
+    else:
+        parser.error("an audiobook path is required unless --batch is used")
+
+    results = {}
+    for audiobook in audiobooks:
+        if not audiobook.exists():
+            _print_not_found(audiobook)
+            if not args.batch:
+                return 1
+            continue
+
+        timecodes = chapters_to_timecodes(_detect(audiobook, args))
+        results[str(audiobook)] = timecodes
+
+        if not args.output:
+            print(f"\n=== Detected Chapters: {audiobook.name} ===" if args.batch
+                  else "\n=== Detected Chapters ===")
+            for i, timecode in enumerate(timecodes, 1):
+                end_str = f" -> {timecode['end']}" if 'end' in timecode else ""
+                print(f"{i}. {timecode['chapter_type']}: {timecode['start']}{end_str}")
+
+    # Output results; batch runs are keyed by audiobook path
     if args.output:
         import json
         with open(args.output, 'w') as f:
-            json.dump(chapters, f, indent=2)
+            json.dump(results if args.batch else timecodes, f, indent=2)
         print(f"\nChapter list saved to: {args.output}")
-    else:
-        print("\n=== Detected Chapters ===")
-        for i, chapter in enumerate(chapters, 1):
-            end_str = f" -> {chapter['end']}" if 'end' in chapter else ""
-            print(f"{i}. {chapter['chapter_type']}: {chapter['start']}{end_str}")
 
     return 0
 
 
+def _detect(audiobook: Path, args: argparse.Namespace) -> list[Chapter]:
+    """Detect chapters in one audiobook using the method selected on the CLI."""
+    if args.method == 'silence':
+        return detect_by_silence(audiobook)
+    elif args.method == 'whisper':
+        return detect_by_whisper(audiobook, model_size=args.model_size,
+                                 device=args.device, compute_type=args.compute_type,
+                                 beam_size=args.beam_size, vad=args.vad)
+    else:  # hybrid
+        return detect_hybrid(audiobook, model_size=args.model_size,
+                             device=args.device, compute_type=args.compute_type,
+                             force_hybrid=args.force_hybrid)
+
+
+def _print_not_found(audiobook: Path) -> None:
+    """Print the file not found help message."""
+    print("\n" + "="*60)
+    print("ERROR: File not found")
+    print("="*60)
+    print(f"\nFile: {audiobook}")
+    print("\nPlease check:")
+    print("  - The file path is correct")
+    print("  - The file exists at the specified location")
+    print("  - You have permission to access the file")
+    print("\nSupported formats: .mp3, .m4b, .m4a")
+    print("\nExample usage:")
+    print(f"  python {Path(__file__).name} audiobook.mp3 --method whisper")
+    print("="*60 + "\n")
+
+
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 
+import os
 import re
 import subprocess
 import argparse
+import hashlib
+import json
 import sys
+import tempfile
 import time
-from typing import Optional
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Optional
 from pathlib import Path
-from shutil import unpack_archive, copytree, rmtree, which
+from shutil import copy2, rmtree, which
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import chain
+from threading import Thread
 
 # Handle tomli/tomllib for different Python versions
 if sys.version_info >= (3, 11):
@@ -41,13 +51,15 @@ from model.models import (
     model_languages,
     get_language_features
 )
+from m4b_support import is_contiguous, pack_outputs, segment_cut_points
 
 # Optional imports for alternative detection methods
 try:
     from chapter_detection_alternatives import (
         detect_by_silence,
         detect_by_whisper,
-        detect_hybrid
+        detect_hybrid,
+        chapters_to_timecodes
     )
     ALTERNATIVES_AVAILABLE = True
 except ImportError:
@@ -64,14 +76,33 @@ __author__ = 'patrickenfuego'
 SAMPLE_RATE = 16000
 AUDIO_CHANNELS = 1
 
-# Download chunk sizes (in bytes)
-CHUNK_SIZE_SMALL = 50
-CHUNK_SIZE_LARGE = 300
+# PCM block size fed to the vosk recognizer per call (in bytes)
+VOSK_READ_SIZE = 1 << 20
+
+# Bytes hashed from each end of the audiobook for its cache fingerprint
+FINGERPRINT_BLOCK_SIZE = 1 << 20
+
+# Words per subtitle line in generated srt files (matches vosk's SrtResult)
+SRT_WORDS_PER_LINE = 7
+
+# Zero-padded number strings for formatting srt timestamps without per-call format parsing
+_PAD2 = tuple(f'{i:02d}' for i in range(100))
+_PAD3 = tuple(f'{i:03d}' for i in range(1000))
+
+# Download chunk sizes (in KB)
+CHUNK_SIZE_SMALL = 1024
+CHUNK_SIZE_LARGE = 4096
 
 # File size thresholds
 MIN_METADATA_SIZE = 10
 MIN_COVER_ART_SIZE = 10
 
+# Default number of concurrent ffmpeg jobs when splitting; half the cores avoids thrashing HDDs
+DEFAULT_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+# Model archives up to this size are extracted from memory (in bytes)
+MODEL_SPOOL_SIZE = 256 << 20
+
 # URLs
 VOSK_URL = "https://alphacephei.com/vosk/models"
 vosk_link = f"[link={VOSK_URL}]this link[/link]"
@@ -79,13 +110,29 @@ vosk_link = f"[link={VOSK_URL}]this link[/link]"
 # Console
 con = Console()
 
+# HH:MM:SS.mmm timecodes used for chapter markers
+TIMECODE_RE = re.compile(r'(\d+):(\d+):(\d+)\.(\d+)')
+
+# Start time of an srt entry, e.g. "00:01:02,345 --> ..."
+SRT_START_RE = re.compile(r'\d\d:\d\d:\d\d,\d+(?=\s-)')
+
+# key = value pairs for the fallback config parser, with optional quotes and trailing comments
+CONFIG_LINE_RE = re.compile(r'^\s*([A-Za-z_]+)\s*=\s*["\']?([^"\'\n#]*?)["\']?\s*(?:#.*)?$', re.M)
+
+# TITLE/START/END entries of a cue file track; quoted values keep any inner quotes
+CUE_LINE_RE = re.compile(r'^\s*(TITLE|START|END)\t+(?:"(.*)"|(.+?))\s*$')
+CUE_FIELDS = {'TITLE': 'chapter_type', 'START': 'start', 'END': 'end'}
+
+# Supported language codes, for constant-time validation
+VALID_LANGUAGE_CODES = frozenset(model_languages.values())
+
 
 '''
     Configuration Management
 '''
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Configuration settings for the application."""
     default_language: str = 'en-us'
@@ -93,6 +140,7 @@ class Config:
     ffmpeg_path: str = 'ffmpeg'
     generate_cue_file: bool = False
     cue_path: str = ''
+    cache_transcripts: bool = True
 
     def validate(self) -> list[str]:
         """Validate configuration values.
@@ -107,7 +155,7 @@ class Config:
                 "Must be 'small' or 'large'."
             )
 
-        if self.default_language not in model_languages.values():
+        if self.default_language not in VALID_LANGUAGE_CODES:
             errors.append(
                 f"Invalid language in config file: '{self.default_language}'"
             )
@@ -115,6 +163,9 @@ class Config:
         if self.generate_cue_file and not isinstance(self.generate_cue_file, bool):
             errors.append("generate_cue_file must be a boolean value")
 
+        if not isinstance(self.cache_transcripts, bool):
+            errors.append("cache_transcripts must be a boolean value")
+
         return errors
 
 
@@ -123,6 +174,15 @@ class Config:
 '''
 
 
+def srt_cache_dir() -> Path:
+    """Directory that transcriptions are cached in, keyed by a fingerprint of the audio
+    rather than its file name.
+
+    :return: $XDG_CACHE_HOME/chapterize, or ~/.cache/chapterize when it isn't set
+    """
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'chapterize'
+
+
 def format_elapsed_time(seconds: float) -> str:
     """Format elapsed time in seconds to a readable string.
 
@@ -146,12 +206,12 @@ def path_exists(path: Path | str) -> Path:
     """Utility function to check if a path exists. Used by argparse.
 
     :param path: File path to verify
-    :return: The tested file path if it exists
+    :return: The tested file path, resolved to an absolute path, if it exists
     :raises argparse.ArgumentTypeError: If the path does not exist
     """
     path_obj = Path(path)
     if path_obj.exists():
-        return path_obj
+        return path_obj.resolve()
     else:
         # Use ArgumentTypeError for better argparse integration
         raise argparse.ArgumentTypeError(
@@ -164,6 +224,7 @@ def path_exists(path: Path | str) -> Path:
         )
 
 
+@lru_cache(maxsize=64)
 def verify_language(language: str) -> str:
     """Verifies that the selected language is valid.
 
@@ -177,13 +238,12 @@ def verify_language(language: str) -> str:
         con.print("[bold red]ERROR:[/] Language option appears to be empty")
         sys.exit(1)
 
-    code = ''
+    code = language.lower()
 
-    if language.lower() in model_languages.values():
-        code = language.lower()
-    elif language.title() in model_languages.keys():
-        code = model_languages[language.title()]
-    else:
+    if code not in VALID_LANGUAGE_CODES:
+        code = model_languages.get(language.title())
+
+    if not code:
         con.print("[bold red]ERROR:[/] Invalid language or language code entered. Possible options:")
         print("\n")
         con.print(Panel(Pretty(model_languages), title="Supported Languages & Codes"))
@@ -193,6 +253,24 @@ def verify_language(language: str) -> str:
     return code
 
 
+@lru_cache(maxsize=None)
+def _model_index() -> tuple[dict[str, str], dict[str, str]]:
+    """Map each supported language code to its small and large model names.
+
+    The first model name containing the code wins, matching the original list scan.
+
+    :return: Tuple of (small, large) dictionaries keyed by language code
+    """
+    def index(model_list: tuple) -> dict[str, str]:
+        by_code = {}
+        for code in set(model_languages.values()):
+            if name := next((line for line in model_list if code in line), None):
+                by_code[code] = name
+        return by_code
+
+    return index(models_small), index(models_large)
+
+
 def verify_download(language: str, model_type: str) -> str:
     """Verifies that the selected language can be downloaded by the script.
 
@@ -204,20 +282,15 @@ def verify_download(language: str, model_type: str) -> str:
     :return: String name of the model file to download if supported.
     """
     lang_code = verify_language(language)
-    name = ''
     other = 'small' if model_type == 'large' else 'large'
 
-    # Search for the model in the appropriate list
-    model_list = models_small if model_type == 'small' else models_large
-    for line in model_list:
-        if lang_code in line:
-            name = line
-            break
+    # Look up the model in the appropriate index
+    small_idx, large_idx = _model_index()
+    name = (small_idx if model_type == 'small' else large_idx).get(lang_code, '')
 
     # If the specified model wasn't found, check for a different size
     if not name:
-        alt_list = models_large if model_type == 'small' else models_small
-        found_alt = any(lang_code in line for line in alt_list)
+        found_alt = lang_code in (large_idx if model_type == 'small' else small_idx)
 
         if found_alt:
             con.print(
@@ -244,8 +317,16 @@ def parse_config() -> Config:
     :return: A Config object containing the configuration settings.
     :raises SystemExit: If config file doesn't exist or can't be parsed
     """
-    config_path = Path.cwd() / 'defaults.toml'
+    return _parse_config_file(Path.cwd() / 'defaults.toml')
+
 
+@lru_cache(maxsize=None)
+def _parse_config_file(config_path: Path) -> Config:
+    """Reads and validates the given config file. Cached, so each path is parsed once per process.
+
+    :param config_path: Path to the defaults.toml file
+    :return: A Config object containing the configuration settings.
+    """
     if not config_path.exists():
         con.print(
             "[bold red]ERROR:[/] Could not locate [blue]defaults.toml[/] file. "
@@ -264,23 +345,17 @@ def parse_config() -> Config:
 
         # Fallback to simple parsing
         try:
-            with open(config_path, 'r') as fp:
-                lines = fp.readlines()
-            defaults = {}
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    defaults[key.strip()] = value.strip().strip("'\"")
+            defaults = dict(CONFIG_LINE_RE.findall(config_path.read_text(encoding='utf-8')))
 
             return Config(
                 default_language=defaults.get('default_language', 'en-us'),
                 default_model=defaults.get('default_model', 'small'),
                 ffmpeg_path=defaults.get('ffmpeg_path', 'ffmpeg'),
-                generate_cue_file=defaults.get('generate_cue_file', 'False') == 'True',
-                cue_path=defaults.get('cue_path', '')
+                generate_cue_file=defaults.get('generate_cue_file', 'False').lower() == 'true',
+                cue_path=defaults.get('cue_path', ''),
+                cache_transcripts=defaults.get('cache_transcripts', 'True').lower() == 'true'
             )
-        except (ValueError, KeyError) as e:
+        except (OSError, UnicodeDecodeError, ValueError) as e:
             con.print(f"[bold red]ERROR:[/] Failed to parse config file: {e}")
             return Config()
 
@@ -294,7 +369,8 @@ def parse_config() -> Config:
             default_model=data.get('default_model', 'small'),
             ffmpeg_path=data.get('ffmpeg_path', 'ffmpeg'),
             generate_cue_file=data.get('generate_cue_file', False),
-            cue_path=data.get('cue_path', '')
+            cue_path=data.get('cue_path', ''),
+            cache_transcripts=data.get('cache_transcripts', True)
         )
 
         # Validate configuration
@@ -305,7 +381,7 @@ def parse_config() -> Config:
             con.print("[yellow]Using default values for invalid settings[/]")
             # Reset invalid values to defaults
             if config.default_model not in ('small', 'large'):
-                config.default_model = 'small'
+                config = replace(config, default_model='small')
 
         return config
 
@@ -314,6 +390,7 @@ def parse_config() -> Config:
         return Config()
 
 
+@lru_cache(maxsize=1)
 def get_ffmpeg_path(config: Config) -> str:
     """Determine the ffmpeg executable path.
 
@@ -395,6 +472,8 @@ def parse_args():
                         metavar='COMMENT', type=str, help='Audiobook comment. Optional metadata field')
     parser.add_argument('--write_cue_file', '-wc', action='store_true', dest='write_cue',
                         help='Generate a cue file in the audiobook directory for editing chapter markers. Can also be set in defaults.toml. Default disabled')
+    parser.add_argument('--no-cache', '-nc', action='store_true', dest='no_cache',
+                        help='Don\'t read or write cached transcriptions. Can also be disabled in defaults.toml with cache_transcripts')
     parser.add_argument('--cue_path', '-cp', nargs='?', default=None, metavar='CUE_PATH', type=path_exists,
                         help='Path to cue file in non-default location (i.e., not in the audiobook directory) containing chapter timecodes. Can also be set in defaults.toml, which has lesser precedence than this argument')
     parser.add_argument('--use-existing-chapters', '-uec', action='store_true', dest='use_existing',
@@ -413,6 +492,11 @@ def parse_args():
                              'Use "mp3" to convert M4B to MP3 for better compatibility (e.g., Apple Music). '
                              'Note: Converting to MP3 requires re-encoding (slower, slight quality loss). '
                              'Default: auto')
+    parser.add_argument('--quiet', '-q', action='store_true', dest='quiet',
+                        help='Skip the metadata panel and timecode table. Timecodes are printed as one JSON line instead. '
+                             'This is the default when output is not a terminal')
+    parser.add_argument('--jobs', '-j', dest='jobs', type=int, default=DEFAULT_JOBS, metavar='JOBS',
+                        help=f'Maximum number of chapter files to write concurrently. Default: {DEFAULT_JOBS}')
 
     args = parser.parse_args()
     config = parse_config()
@@ -484,26 +568,27 @@ def parse_args():
             f"[bright_magenta]Cue file <<[/] [blue]custom path[/]: Reading cue file from [green]{cue_file}[/]"
         )
     elif config.cue_path:
-        if not Path(config.cue_path).exists():
+        cue_file = Path(config.cue_path)
+        if not cue_file.exists():
             con.print(
                 "[bold yellow]WARNING:[/] Cue file in [blue]defaults.toml[/] does not exist and will be skipped"
             )
             cue_file = None
         else:
-            cue_file = Path(config.cue_path)
             con.print(
                 f"[bright_magenta]Cue file <<[/] [blue]default.toml[/]: Reading cue file from [green]{cue_file}[/]"
             )
-    elif (
-            args.write_cue or
-            config.generate_cue_file or
-            args.audiobook.with_suffix('.cue').exists()
-        ):
-        cue_file = args.audiobook.with_suffix('.cue')
-        method = ('Writing', 'to') if not cue_file.exists() else ('Reading', 'from')
-        con.print(f"[bright_magenta]Cue file[/]: {method[0]} cue file {method[1]} [green]{cue_file}[/]")
     else:
-        cue_file = None
+        # Stat the default cue path once; it decides both whether and how the cue file is used
+        default_cue = args.audiobook.with_suffix('.cue')
+        cue_exists = default_cue.exists()
+
+        if args.write_cue or config.generate_cue_file or cue_exists:
+            cue_file = default_cue
+            method = ('Writing', 'to') if not cue_exists else ('Reading', 'from')
+            con.print(f"[bright_magenta]Cue file[/]: {method[0]} cue file {method[1]} [green]{cue_file}[/]")
+        else:
+            cue_file = None
 
     if cue_file:
         print("\n")
@@ -517,7 +602,9 @@ def parse_args():
     # Get ffmpeg path
     ffmpeg = get_ffmpeg_path(config)
 
-    return args.audiobook, meta_fields, language, model_name, model_type, cue_file, ffmpeg, args.use_existing, args.detection_method, args.output_format
+    use_cache = config.cache_transcripts and not args.no_cache
+
+    return args.audiobook, meta_fields, language, model_name, model_type, cue_file, ffmpeg, args.use_existing, args.detection_method, args.output_format, args.jobs, args.quiet, use_cache
 
 
 def build_progress(bar_type: str) -> Progress:
@@ -556,11 +643,16 @@ def build_progress(bar_type: str) -> Progress:
     return progress
 
 
-def print_table(list_dicts: list[dict]) -> None:
+def print_table(list_dicts: list[dict], rich_output: bool = True) -> None:
     """Formats a list of dictionaries into a table. Currently only used for timecodes.
 
     :param list_dicts: List of dictionaries to format
+    :param rich_output: Render a rich table. If False, print the list as a single JSON line instead
     """
+    if not rich_output:
+        print(json.dumps(list_dicts))
+        return
+
     table = Table(
         title='[bold magenta]Parsed Timecodes for Chapters[/]',
         caption='[red]EOF[/] = End of File'
@@ -591,47 +683,34 @@ def extract_metadata(audiobook_path: Path, ffmpeg: str) -> dict:
     :param ffmpeg: Path to ffmpeg executable
     :return: A dictionary containing metadata values
     """
-    metadata_file = audiobook_path.parent / 'metadata.txt'
-
-    # Extract metadata to file using ffmpeg
+    # Extract metadata to stdout using ffmpeg; the blob is tiny so there's no need for a file
     try:
-        subprocess.run(
+        completed = subprocess.run(
             [ffmpeg, '-y', '-loglevel', 'quiet', '-i', str(audiobook_path),
-             '-f', 'ffmetadata', str(metadata_file)],
+             '-f', 'ffmetadata', 'pipe:1'],
             check=True,
-            capture_output=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
     except subprocess.CalledProcessError as e:
         con.print(f"[bold yellow]WARNING:[/] Failed to extract metadata: {e}")
         return {}
 
     meta_dict = {}
-    # If path exists and has some content
-    try:
-        if metadata_file.exists() and metadata_file.stat().st_size > MIN_METADATA_SIZE:
-            con.print("[bold green]SUCCESS![/] Metadata extraction complete")
-            with open(metadata_file, 'r', encoding='utf-8', errors='ignore') as fp:
-                meta_lines = fp.readlines()
+    # If ffmpeg produced some content
+    if len(completed.stdout) > MIN_METADATA_SIZE:
+        con.print("[bold green]SUCCESS![/] Metadata extraction complete")
 
-            for line in meta_lines:
-                if '=' not in line:
-                    continue
-                parts = line.split('=', 1)
-                if len(parts) == 2:
-                    key, value = [x.strip() for x in parts]
-                    if key in ['title', 'genre', 'album_artist', 'artist', 'album', 'year']:
-                        meta_dict[key] = value
-        else:
-            con.print("[bold yellow]WARNING:[/] Failed to parse metadata file, or none was found")
-    except (OSError, UnicodeDecodeError) as e:
-        con.print(f"[bold yellow]WARNING:[/] Error reading metadata file: {e}")
-    finally:
-        # Delete the metadata file once done
-        if metadata_file.exists():
-            try:
-                metadata_file.unlink()
-            except OSError:
-                pass
+        for line in completed.stdout.decode('utf-8', 'ignore').splitlines():
+            if '=' not in line:
+                continue
+            parts = line.split('=', 1)
+            if len(parts) == 2:
+                key, value = [x.strip() for x in parts]
+                if key in ['title', 'genre', 'album_artist', 'artist', 'album', 'year']:
+                    meta_dict[key] = value
+    else:
+        con.print("[bold yellow]WARNING:[/] Failed to parse metadata file, or none was found")
 
     return meta_dict
 
@@ -639,6 +718,9 @@ def extract_metadata(audiobook_path: Path, ffmpeg: str) -> dict:
 def extract_coverart(audiobook_path: Path, ffmpeg: str) -> Optional[Path]:
     """Extract cover art file from audiobook if present.
 
+    Doesn't print anything, so it can run on a worker thread while the main thread owns
+    the console; the caller reports the result.
+
     :param audiobook_path: Input audiobook file
     :param ffmpeg: Path to ffmpeg executable
     :return: Path to cover art jpg file if found, otherwise None
@@ -650,105 +732,162 @@ def extract_coverart(audiobook_path: Path, ffmpeg: str) -> Optional[Path]:
             [ffmpeg, '-y', '-loglevel', 'quiet', '-i', str(audiobook_path),
              '-an', '-c:v', 'copy', str(cover_art)],
             check=True,
-            capture_output=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
 
         if cover_art.exists() and cover_art.stat().st_size > MIN_COVER_ART_SIZE:
-            con.print("[bold green]SUCCESS![/] Cover art extracted")
-            print("\n")
             return cover_art
         else:
-            con.print("[bold yellow]WARNING:[/] Failed to extract cover art, or none was found")
-            print("\n")
             return None
 
     except subprocess.CalledProcessError:
-        con.print("[bold yellow]WARNING:[/] Failed to extract cover art, or none was found")
-        print("\n")
         return None
 
 
+@dataclass
+class ModelDownload:
+    """A vosk model download running on a background thread.
+
+    Only the worker thread writes these fields, and only the main thread prints them, so
+    the download never touches the console from another thread.
+    """
+    name: str
+    thread: Optional[Thread] = None
+    size: int = 0
+    received: int = 0
+    message: str = ''
+    exit_code: int = 0
+
+
 def download_model(name: str) -> None:
     """Downloads the specified language model from vosk (if available).
 
     :param name: Name of the model found on the vosk website
     :raises SystemExit: If download fails or requests library is unavailable
     """
+    finish_model_download(start_model_download(name))
+
+
+def start_model_download(name: str) -> ModelDownload:
+    """Start downloading the specified language model on a background thread.
+
+    :param name: Name of the model found on the vosk website
+    :return: The running download, to pass to `finish_model_download`
+    """
+    download = ModelDownload(name)
+    download.thread = Thread(target=_fetch_model, args=(download,), name=f'download-{name}', daemon=True)
+    download.thread.start()
+    return download
+
+
+def finish_model_download(download: ModelDownload) -> None:
+    """Show the download's progress until it completes, then report the outcome.
+
+    Must be called from the main thread, which owns the console.
+
+    :param download: Download started by `start_model_download`
+    :raises SystemExit: If download fails or requests library is unavailable
+    """
+    if download.thread.is_alive():
+        progress = build_progress(bar_type='download')
+        with progress:
+            task = progress.add_task("", noun=download.name, verb='Downloading')
+            while download.thread.is_alive():
+                progress.update(task, total=download.size, completed=download.received)
+                download.thread.join(0.1)
+            progress.update(task, total=download.size, completed=download.received)
+    download.thread.join()
+
+    con.print(download.message)
+    if download.exit_code:
+        sys.exit(download.exit_code)
+    print("\n")
+
+
+def _fetch_model(download: ModelDownload) -> None:
+    """Download and extract a vosk model, recording progress and the outcome in `download`.
+
+    Runs on a worker thread, so it never prints or exits; `finish_model_download` does.
+
+    :param download: Download to fill in
+    """
     try:
         import requests
         from requests.exceptions import ConnectionError as ReqConnectionError, RequestException
     except ImportError:
-        con.print(
+        download.message = (
             "[bold red]CRITICAL:[/] requests library is not available, and is required for "
             "downloading models. Run [bold green]pip install requests[/] and re-run the script."
         )
-        sys.exit(18)
+        download.exit_code = 18
+        return
 
+    name = download.name
     full_url = f'{VOSK_URL}/{name}.zip'
     out_base = Path(__file__).parent.absolute() / 'model'
-    out_zip = out_base / f'{name}.zip'
     out_dir = out_base / name
 
     if out_dir.exists():
-        con.print("[bold yellow]it appears you already have the model downloaded. Sweet![/]")
+        download.message = "[bold yellow]it appears you already have the model downloaded. Sweet![/]"
         return
 
-    progress = build_progress(bar_type='download')
-
-    try:
-        with requests.get(full_url, stream=True, allow_redirects=True, timeout=30) as req:
-            if req.status_code != 200:
-                raise ReqConnectionError(
-                    f"Failed to download the model file: {full_url}. HTTP Response: {req.status_code}"
-                )
+    # Download straight into a spooled buffer so no zip is left on disk; only
+    # archives larger than MODEL_SPOOL_SIZE spill over to an anonymous temp file
+    with tempfile.SpooledTemporaryFile(max_size=MODEL_SPOOL_SIZE) as archive:
+        try:
+            with requests.get(full_url, stream=True, allow_redirects=True, timeout=30) as req:
+                if req.status_code != 200:
+                    raise ReqConnectionError(
+                        f"Failed to download the model file: {full_url}. HTTP Response: {req.status_code}"
+                    )
+
+                download.size = int(req.headers.get('Content-Length', 0))
+                chunk_size = CHUNK_SIZE_SMALL if 'small' in name else CHUNK_SIZE_LARGE
+
+                # Read the raw stream in large blocks to bypass iter_content's per-chunk overhead
+                req.raw.decode_content = True
+                while chunk := req.raw.read(chunk_size * 1024):
+                    archive.write(chunk)
+                    download.received += len(chunk)
+        except RequestException as e:
+            download.message = f"[bold red]ERROR:[/] Failed to download model: {e}"
+            download.exit_code = 19
+            return
 
-            size = int(req.headers.get('Content-Length', 0))
-            chunk_size = CHUNK_SIZE_SMALL if 'small' in name else CHUNK_SIZE_LARGE
-            task = progress.add_task("", size=size, noun=name, verb='Downloading')
-            progress.update(task, total=size)
-
-            with open(out_zip, 'wb') as dest_file:
-                with progress:
-                    for chunk in req.iter_content(chunk_size=chunk_size * 1024):
-                        if chunk:
-                            dest_file.write(chunk)
-                            progress.update(task, advance=len(chunk))
-    except RequestException as e:
-        con.print(f"[bold red]ERROR:[/] Failed to download model: {e}")
-        sys.exit(19)
+        try:
+            archive.seek(0)
+            with zipfile.ZipFile(archive) as zf:
+                zf.extractall(out_dir)
+        except (OSError, zipfile.BadZipFile) as e:
+            download.message = (
+                f"[bold red]ERROR:[/] Model archive downloaded successfully, but failed to extract: {e}. "
+                f"Download the model manually from {vosk_link} and extract it into the model directory."
+            )
+            download.exit_code = 4
+            return
 
     try:
-        unpack_archive(str(out_zip), str(out_dir))
-
         if out_dir.exists():
-            con.print("[bold green]SUCCESS![/] Model downloaded and extracted successfully")
-            print("\n")
-            out_zip.unlink()
-
-            # If it extracts inside another directory, copy up and remove extra
+            # If it extracts inside another directory, move it up and remove the extra level
             child_dir = out_dir / name
             if child_dir.exists():
-                temp_name = f"{name}-new"
-                child_dir.rename(out_base / temp_name)
-                child_dir_new = copytree(out_base / temp_name, out_base / temp_name + "-copy")
+                temp_dir = out_base / f"{name}-tmp"
+                child_dir.rename(temp_dir)
                 rmtree(out_dir)
-                child_dir_new.rename(out_dir)
-        elif out_zip.exists() and not out_dir.exists():
-            con.print(
-                "[bold red]ERROR:[/] Model archive downloaded successfully, but failed to extract. "
-                "Manually extract the archive into the model directory and re-run the script."
-            )
-            sys.exit(4)
+                temp_dir.rename(out_dir)
+
+            download.message = "[bold green]SUCCESS![/] Model downloaded and extracted successfully"
         else:
-            con.print(
+            download.message = (
                 "[bold red]CRITICAL:[/] Model archive failed to download. The selected model "
                 f"might not be supported by the script, or is unavailable. Follow {vosk_link} "
                 "to download a model manually.\n"
             )
-            sys.exit(5)
+            download.exit_code = 5
     except (OSError, ValueError) as e:
-        con.print(f"[bold red]CRITICAL:[/] Failed to unpack or rename the model: {e}")
-        sys.exit(29)
+        download.message = f"[bold red]CRITICAL:[/] Failed to unpack or rename the model: {e}"
+        download.exit_code = 29
 
 
 def convert_time(time: str) -> str:
@@ -760,38 +899,17 @@ def convert_time(time: str) -> str:
     :return: Adjusted time marker
     :raises ValueError: If time format is invalid
     """
-    try:
-        # Parse the time string
-        parts = time.split(':')
-        if len(parts) != 3:
-            raise ValueError(f"Invalid time format: {time}")
-
-        last_part = parts[-1]
-        if '.' not in last_part:
-            raise ValueError(f"Missing milliseconds in time: {time}")
+    if not (match := TIMECODE_RE.fullmatch(time)):
+        message = f"Invalid time format: {time}"
+        con.print(f"[bold red]ERROR:[/] Could not convert end chapter marker for {time}: {message}")
+        raise ValueError(message)
 
-        seconds, milliseconds = last_part.split('.')
+    hours, minutes, secs, milliseconds = match.groups()
 
-        # Create a timedelta and subtract 1 second
-        hours = int(parts[0])
-        minutes = int(parts[1])
-        secs = int(seconds)
+    # Convert to total seconds, subtract 1, then convert back
+    total_seconds = max(int(hours) * 3600 + int(minutes) * 60 + int(secs) - 1, 0)
 
-        # Convert to total seconds, subtract 1, then convert back
-        total_seconds = hours * 3600 + minutes * 60 + secs - 1
-
-        if total_seconds < 0:
-            total_seconds = 0
-
-        new_hours = total_seconds // 3600
-        new_minutes = (total_seconds % 3600) // 60
-        new_seconds = total_seconds % 60
-
-        return f"{new_hours:02d}:{new_minutes:02d}:{new_seconds:02d}.{milliseconds}"
-
-    except (ValueError, IndexError) as e:
-        con.print(f"[bold red]ERROR:[/] Could not convert end chapter marker for {time}: {e}")
-        raise
+    return f"{total_seconds // 3600:02d}:{total_seconds // 60 % 60:02d}:{total_seconds % 60:02d}.{milliseconds}"
 
 
 def split_file(audiobook_path: Path,
@@ -799,7 +917,8 @@ def split_file(audiobook_path: Path,
                metadata: dict,
                cover_art: Optional[Path],
                ffmpeg: str,
-               output_format: str = 'auto') -> None:
+               output_format: str = 'auto',
+               jobs: int = DEFAULT_JOBS) -> None:
     """Splits a single audiobook file into chapterized segments.
 
     Supports MP3, M4B, and M4A formats. Output format can match input or be converted.
@@ -810,6 +929,7 @@ def split_file(audiobook_path: Path,
     :param cover_art: Optional path to cover art
     :param ffmpeg: Path to ffmpeg executable
     :param output_format: Output format - 'auto' (matches input), 'mp3', or 'm4b'
+    :param jobs: Maximum number of chapter files to tag concurrently
     """
     file_stem = audiobook_path.stem
     file_ext = audiobook_path.suffix.lower()
@@ -844,99 +964,195 @@ def split_file(audiobook_path: Path,
         except OSError:
             pass
 
-    command = [ffmpeg, '-y', '-hide_banner', '-loglevel', 'info', '-i', str(audiobook_path)]
+    ffmpeg_base = [ffmpeg, '-y', '-hide_banner', '-loglevel', 'info']
 
-    # Handle cover art and stream mapping based on output format and encoding requirements
-    if requires_encoding:
-        # Need to re-encode audio
-        if output_ext == '.mp3':
-            # Converting to MP3 - use libmp3lame encoder
-            if cover_art:
-                command.extend(['-i', str(cover_art), '-id3v2_version', '3', '-metadata:s:v', 'comment="Cover (front)"'])
-                stream = ['-map', '0:a', '-map', '1:0', '-c:a', 'libmp3lame', '-b:a', '192k', '-c:v', 'copy']
-            else:
-                command.extend(['-id3v2_version', '3'])
-                stream = ['-c:a', 'libmp3lame', '-b:a', '192k']
-        else:  # output_ext == '.m4b'
-            # Converting to M4B - use AAC encoder
-            stream = ['-c:a', 'aac', '-b:a', '192k']
+    # Audio codec for the split pass; only this pass ever decodes the source
+    if requires_encoding and output_ext == '.mp3':
+        audio_codec = ['-c:a', 'libmp3lame', '-b:a', '192k']
+    elif requires_encoding:
+        audio_codec = ['-c:a', 'aac', '-b:a', '192k']
     else:
-        # Same format - use stream copy (fast, no quality loss)
-        if cover_art and output_ext == '.mp3':
-            # MP3: Add cover art via ID3v2 tags
-            command.extend(['-i', str(cover_art), '-id3v2_version', '3', '-metadata:s:v', 'comment="Cover (front)"'])
-            stream = ['-map', '0:0', '-map', '1:0', '-c', 'copy']
-        elif output_ext == '.mp3':
-            # MP3 without cover art
-            command.extend(['-id3v2_version', '3'])
-            stream = ['-c', 'copy']
-        else:
-            # M4B/M4A: Just copy audio stream, skip external cover art
-            # (Cover art from source M4B is preserved automatically with -c copy)
-            stream = ['-c', 'copy']
+        # Same format - use stream copy (fast, no quality loss). Cuts land on packet
+        # boundaries, so shift each segment's first timestamp back to zero
+        audio_codec = ['-c:a', 'copy', '-avoid_negative_ts', 'make_zero']
+
+    # Cover art and tagging options for the per-chapter remux
+    if cover_art and output_ext == '.mp3':
+        # MP3: Add cover art via ID3v2 tags
+        cover_input = ['-i', str(cover_art)]
+        tag_stream = ['-map', '0:a', '-map', '1:0', '-c', 'copy', '-id3v2_version', '3',
+                      '-metadata:s:v', 'comment="Cover (front)"']
+    elif output_ext == '.mp3':
+        cover_input = []
+        tag_stream = ['-c', 'copy', '-id3v2_version', '3']
+    elif cover_art:
+        # M4B/M4A: The split pass maps audio only, so embed the extracted art as an attached picture
+        cover_input = ['-i', str(cover_art)]
+        tag_stream = ['-map', '0:a', '-map', '1:0', '-c', 'copy', '-disposition:v:0', 'attached_pic']
+    else:
+        cover_input = []
+        tag_stream = ['-c', 'copy']
 
     # Handle metadata strings if they exist
+    tags = []
     if 'album_artist' in metadata:
-        command.extend(['-metadata', f"album_artist={metadata['album_artist']}",
-                        '-metadata', f"artist={metadata['album_artist']}"])
+        tags.extend(['-metadata', f"album_artist={metadata['album_artist']}",
+                     '-metadata', f"artist={metadata['album_artist']}"])
     if 'genre' in metadata:
-        command.extend(['-metadata', f"genre={metadata['genre']}"])
+        tags.extend(['-metadata', f"genre={metadata['genre']}"])
     if 'album' in metadata:
-        command.extend(['-metadata', f"album={metadata['album']}"])
+        tags.extend(['-metadata', f"album={metadata['album']}"])
     if 'date' in metadata:
-        command.extend(['-metadata', f"date={metadata['date']}"])
+        tags.extend(['-metadata', f"date={metadata['date']}"])
     if 'comment' in metadata:
-        command.extend(['-metadata', f"comment={metadata['comment']}"])
+        tags.extend(['-metadata', f"comment={metadata['comment']}"])
     if 'description' in metadata:
-        command.extend(['-metadata', f"description={metadata['description']}"])
+        tags.extend(['-metadata', f"description={metadata['description']}"])
     if 'narrator' in metadata:
-        command.extend(['-metadata', f"composer={metadata['narrator']}"])
-
-    progress = build_progress(bar_type='chapterize')
+        tags.extend(['-metadata', f"composer={metadata['narrator']}"])
+
+    # The segment muxer can only cut at boundaries shared by consecutive chapters
+    contiguous = is_contiguous(timecodes)
+    cut_points, first_segment = segment_cut_points(timecodes) if contiguous else ([], 0)
+
+    # Segments are written next to the audiobook so the remux stays on one filesystem; every
+    # ffmpeg run shares one log descriptor instead of reopening the log per chapter
+    with tempfile.TemporaryDirectory(prefix=f'{file_stem}_', dir=audiobook_path.parent) as tmp_dir, \
+            _open_ffmpeg_log(log_path) as log_fp:
+
+        def run_logged(cmd: list[str]) -> None:
+            if log_fp is None:
+                subprocess.run(cmd, check=False)
+                return
+            # Unbuffered O_APPEND writes are atomic, so separators and ffmpeg output from
+            # concurrent runs never tear each other's lines
+            log_fp.write(f'---------------- {Path(cmd[-1]).name} ----------------\n\n'.encode())
+            subprocess.run(cmd, stdout=log_fp, stderr=log_fp, check=False)
+
+        segment_pattern = Path(tmp_dir) / f'chap_%03d{output_ext}'
+
+        # Demux (and, if needed, encode) the source once, cutting at every chapter boundary
+        con.print(f"[dim cyan]Splitting {len(timecodes)} chapters in a single pass...[/]")
+        # The source's chapter list would otherwise be copied whole into every segment
+        input_command = [*ffmpeg_base, '-i', str(audiobook_path)]
+        if contiguous:
+            split_command = [*input_command, '-map', '0:a', '-map_chapters', '-1', *audio_codec]
+            if cut_points:
+                split_command.extend(['-f', 'segment', '-segment_times', ','.join(cut_points),
+                                      '-reset_timestamps', '1', '-segment_start_number', '0',
+                                      str(segment_pattern)])
+            else:
+                # A single chapter covering the whole file needs no segmenting
+                split_command.append(str(segment_pattern).replace('%03d', f'{0:03d}'))
+            run_logged(split_command)
+        else:
+            # Gaps between chapters (like the second left before each parsed end marker) or
+            # out-of-order markers aren't cut points, so trim each chapter to its own markers
+            for split_command in _chapter_cut_commands(input_command, timecodes, audio_codec, segment_pattern):
+                run_logged(split_command)
 
-    with progress:
-        task = progress.add_task('', total=len(timecodes), verb='Processing', noun='Audiobook...')
+        progress = build_progress(bar_type='chapterize')
 
-        for counter, times in enumerate(timecodes, start=1):
-            counter_str = f'{counter:02d}'
-            command_copy = command.copy()
+        with progress:
+            task = progress.add_task('', total=len(timecodes), verb='Processing', noun='Audiobook...')
 
-            if 'start' in times:
-                command_copy[5:5] = ['-ss', times['start']]
-            if 'end' in times:
-                command_copy[7:7] = ['-to', times['end']]
+            remux_jobs = []
+            status_lines = []
+            for counter, times in enumerate(timecodes, start=1):
+                counter_str = f'{counter:02d}'
+                segment_path = Path(tmp_dir) / f'chap_{first_segment + counter - 1:03d}{output_ext}'
 
-            if 'chapter_type' in times:
-                file_path = audiobook_path.parent / f"{file_stem} {counter_str} - {times['chapter_type']}{output_ext}"
-            else:
-                file_path = audiobook_path.parent / f"{file_stem} - {counter_str}{output_ext}"
+                if 'chapter_type' in times:
+                    file_path = audiobook_path.parent / f"{file_stem} {counter_str} - {times['chapter_type']}{output_ext}"
+                else:
+                    file_path = audiobook_path.parent / f"{file_stem} - {counter_str}{output_ext}"
 
-            # Log which file is being created
-            chapter_name = times.get('chapter_type', f'Chapter {counter_str}')
-            con.print(f"[dim cyan]Creating ({counter}/{len(timecodes)}):[/] [green]{chapter_name}[/] → [blue]{file_path.name}[/]")
+                # Log which file is being created
+                chapter_name = times.get('chapter_type', f'Chapter {counter_str}')
+                status_lines.append(
+                    f"[dim cyan]Creating ({counter}/{len(timecodes)}):[/] [green]{chapter_name}[/] → [blue]{file_path.name}[/]"
+                )
 
-            track_num = ['-metadata', f"track={counter}/{len(timecodes)}"]
-            command_copy.extend([*stream, *track_num, '-metadata', f"title={times['chapter_type']}",
-                                 str(file_path)])
+                if not segment_path.exists():
+                    status_lines.append(f"[bold yellow]WARNING:[/] ffmpeg did not produce a segment for {chapter_name}")
+                    progress.update(task, advance=1)
+                    continue
 
-            try:
-                with open(log_path, 'a+', encoding='utf-8') as fp:
-                    fp.write('----------------------------------------------------\n\n')
-                    subprocess.run(command_copy, stdout=fp, stderr=fp, check=False)
-            except OSError as e:
-                con.print(
-                    f"[bold red]ERROR:[/] An exception occurred writing logs to file: "
-                    f"{e}\nOutputting to stdout..."
+                # Stream-copy remux of the small segment to apply tags and cover art
+                track_num = ['-metadata', f"track={counter}/{len(timecodes)}"]
+                remux_jobs.append(
+                    [*ffmpeg_base, '-i', str(segment_path), *cover_input, *tag_stream, *tags,
+                     *track_num, '-metadata', f"title={chapter_name}", str(file_path)]
                 )
-                subprocess.run(command_copy, stdout=subprocess.STDOUT, check=False)
 
-            progress.update(task, advance=1)
+            # Render the whole chapter list in one console write rather than one per chapter
+            con.print('\n'.join(status_lines))
+
+            # Chapters are independent, so remux them concurrently
+            if remux_jobs:
+                with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(remux_jobs)))) as pool:
+                    futures = [pool.submit(run_logged, cmd) for cmd in remux_jobs]
+                    for future in as_completed(futures):
+                        future.result()
+                        progress.update(task, advance=1)
+
+
+@contextmanager
+def _open_ffmpeg_log(log_path: Path):
+    """Open the ffmpeg log for unbuffered appending, shared by every ffmpeg run of a split.
+
+    :param log_path: Path to the log file
+    :return: Context manager yielding the binary log file, or None if it can't be opened
+    """
+    try:
+        log_fp = open(log_path, 'ab', buffering=0)
+    except OSError as e:
+        con.print(
+            f"[bold red]ERROR:[/] An exception occurred writing logs to file: "
+            f"{e}\nOutputting to stdout..."
+        )
+        yield None
+        return
+
+    with log_fp:
+        yield log_fp
+
+
+def _chapter_cut_commands(input_command: list[str],
+                          timecodes: list[dict],
+                          audio_codec: list[str],
+                          segment_pattern: Path) -> list[list[str]]:
+    """Build ffmpeg commands that trim every chapter to its own start/end markers.
+
+    Each command reads the source once and writes several chapters as separate outputs, packing
+    as many as fit in the OS command line length limit.
+
+    :param input_command: ffmpeg executable, global options and input
+    :param timecodes: List of start/end markers for each chapter
+    :param audio_codec: Codec options for each output
+    :param segment_pattern: Output path with a ``%03d`` placeholder for the chapter index
+    :return: ffmpeg commands writing ``segment_pattern`` files numbered from zero
+    """
+    outputs = []
+    for index, times in enumerate(timecodes):
+        segment_path = Path(str(segment_pattern).replace('%03d', f'{index:03d}'))
+        output = ['-map', '0:a', '-map_chapters', '-1', '-ss', times.get('start', '00:00:00.000')]
+        if 'end' in times:
+            output.extend(['-to', times['end']])
+        output.extend([*audio_codec, str(segment_path)])
+        outputs.append((output, segment_path))
+
+    return [
+        [*input_command, *(arg for output, _ in group for arg in output)]
+        for group in pack_outputs(input_command, outputs)
+    ]
 
 
 def generate_timecodes_smart(audiobook_path: Path,
                             language: str,
                             model_type: str,
-                            detection_method: str = 'auto') -> list[dict]:
+                            detection_method: str = 'auto',
+                            use_cache: bool = True) -> list[dict]:
     """
     Generate chapter timecodes using the specified or auto-detected method.
 
@@ -951,6 +1167,7 @@ def generate_timecodes_smart(audiobook_path: Path,
     :param language: Language code for transcription
     :param model_type: Model size (small/large)
     :param detection_method: Detection method to use
+    :param use_cache: Read and write cached vosk transcriptions
     :return: List of chapter dictionaries
     :raises SystemExit: If method fails or dependencies missing
     """
@@ -982,7 +1199,7 @@ def generate_timecodes_smart(audiobook_path: Path,
             message = "[magenta]Sit tight, this might take a [u]long[/u] while[/magenta]..."
 
         with con.status(message, spinner='pong'):
-            timecodes_file = generate_timecodes(audiobook_path, language, model_type)
+            timecodes_file = generate_timecodes(audiobook_path, language, model_type, use_cache)
 
         # Parse the SRT file
         try:
@@ -1025,11 +1242,13 @@ def generate_timecodes_smart(audiobook_path: Path,
             if detection_method == 'whisper':
                 # Map model_type to whisper model size
                 whisper_model = 'base' if model_type == 'small' else 'small'
-                timecodes = method_func(audiobook_path, model_size=whisper_model, language=language[:2])
+                chapters = method_func(audiobook_path, model_size=whisper_model, language=language[:2])
             elif detection_method == 'hybrid':
-                timecodes = method_func(audiobook_path, model_size='tiny')
+                chapters = method_func(audiobook_path, model_size='tiny')
             else:  # silence
-                timecodes = method_func(audiobook_path)
+                chapters = method_func(audiobook_path)
+
+            timecodes = chapters_to_timecodes(chapters)
 
             con.print(f"[bold green]SUCCESS![/] {len(timecodes)} chapters detected using {method_name}")
             return timecodes
@@ -1040,9 +1259,9 @@ def generate_timecodes_smart(audiobook_path: Path,
             if detection_method == 'whisper':
                 con.print("  pip install faster-whisper")
             elif detection_method == 'hybrid':
-                con.print("  pip install pydub faster-whisper")
+                con.print("  pip install numpy faster-whisper")
             else:  # silence
-                con.print("  pip install pydub")
+                con.print("  pip install numpy")
             sys.exit(16)
         except Exception as e:
             con.print(f"[bold red]ERROR:[/] {method_name} failed: {e}")
@@ -1053,7 +1272,44 @@ def generate_timecodes_smart(audiobook_path: Path,
         sys.exit(18)
 
 
-def generate_timecodes(audiobook_path: Path, language: str, model_type: str) -> Path:
+def audio_fingerprint(audiobook_path: Path, *extra: str) -> str:
+    """Fingerprint an audiobook by its size and the first and last megabyte of its content.
+
+    Cheap to compute even for multi-GB files, and unaffected by renaming or copying the file.
+
+    :param audiobook_path: Path to audiobook file
+    :param extra: Additional strings that should change the fingerprint (e.g. language and model)
+    :return: Hex digest identifying the audio
+    """
+    size = audiobook_path.stat().st_size
+    digest = hashlib.blake2b(size.to_bytes(8, 'little'), digest_size=16)
+
+    with open(audiobook_path, 'rb') as fp:
+        digest.update(fp.read(FINGERPRINT_BLOCK_SIZE))
+        fp.seek(max(size - FINGERPRINT_BLOCK_SIZE, 0))
+        digest.update(fp.read(FINGERPRINT_BLOCK_SIZE))
+
+    for value in extra:
+        digest.update(b'\0' + value.encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=2)
+def _load_vosk_model(language: str, model_path: Optional[str]) -> Model:
+    """Load a vosk model, reusing it for later audiobooks processed by the same process.
+
+    Recognizers hold per-stream state, so only the model itself is shared.
+
+    :param language: Language of the model
+    :param model_path: Path to a local model directory, or None to let vosk fetch one
+    :return: The loaded vosk Model
+    """
+    SetLogLevel(-1)
+    return Model(lang=language, model_path=model_path)
+
+
+def generate_timecodes(audiobook_path: Path, language: str, model_type: str, use_cache: bool = True) -> Path:
     """Generate chapter timecodes using vosk Machine Learning API.
 
     This function searches for the specified model/language within the project's 'models' directory and
@@ -1064,6 +1320,7 @@ def generate_timecodes(audiobook_path: Path, language: str, model_type: str) ->
     :param audiobook_path: Path to input audiobook file
     :param language: Language used by the parser
     :param model_type: The type of model (large or small)
+    :param use_cache: Reuse a cached transcription of the same audio, and cache new ones
     :return: Path to timecode file
     :raises SystemExit: If model cannot be loaded or timecode generation fails
     """
@@ -1076,6 +1333,21 @@ def generate_timecodes(audiobook_path: Path, language: str, model_type: str) ->
         print("\n")
         return out_file
 
+    # A renamed or copied audiobook reuses its earlier transcription from the cache
+    cached_srt = None
+    if use_cache:
+        try:
+            cache_dir = srt_cache_dir()
+            cached_srt = cache_dir / f'{audio_fingerprint(audiobook_path, language, model_type)}.srt'
+            if cached_srt.exists() and cached_srt.stat().st_size > MIN_METADATA_SIZE:
+                copy2(cached_srt, out_file)
+                con.print(f"[bold green]SUCCESS![/] A cached srt timecode file was found in [blue]{cache_dir}[/]")
+                print("\n")
+                return out_file
+        except (OSError, RuntimeError):
+            # Path.home() raises RuntimeError when there's no home directory to fall back to
+            cached_srt = None
+
     try:
         model_path = [d for d in model_root.iterdir() if d.is_dir() and language in d.stem]
 
@@ -1112,10 +1384,8 @@ def generate_timecodes(audiobook_path: Path, language: str, model_type: str) ->
         )
         model_path = None
 
-    SetLogLevel(-1)
-
     try:
-        model = Model(lang=language, model_path=str(model_path) if model_path else None)
+        model = _load_vosk_model(language, str(model_path) if model_path else None)
         rec = KaldiRecognizer(model, SAMPLE_RATE)
         rec.SetWords(True)
     except Exception as e:
@@ -1123,29 +1393,47 @@ def generate_timecodes(audiobook_path: Path, language: str, model_type: str) ->
         sys.exit(7)
 
     try:
-        # Get ffmpeg path
-        ffmpeg = get_ffmpeg_path(parse_config())
+        # Decode in-process with PyAV when it's installed, skipping the ffmpeg process and pipe
+        try:
+            import av
+        except ImportError:
+            av = None
 
-        # Convert the file to wav format and stream output
-        process = subprocess.Popen(
-            [ffmpeg, "-loglevel", "quiet", "-i", str(audiobook_path),
-             "-ar", str(SAMPLE_RATE), "-ac", str(AUDIO_CHANNELS), "-f", "s16le", "-"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        if av is not None:
+            write_srt_from_pcm(rec, _av_pcm_blocks(av, audiobook_path), out_file)
+            decoded = True
+        else:
+            # Get ffmpeg path
+            ffmpeg = get_ffmpeg_path(parse_config())
+
+            # Convert the file to wav format and stream output
+            process = subprocess.Popen(
+                [ffmpeg, "-loglevel", "quiet", "-i", str(audiobook_path),
+                 "-ar", str(SAMPLE_RATE), "-ac", str(AUDIO_CHANNELS), "-f", "s16le", "-"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=VOSK_READ_SIZE
+            )
 
-        with process.stdout as stream:
-            with open(out_file, 'w+', encoding='utf-8') as fp:
-                fp.writelines(rec.SrtResult(stream))
+            with process.stdout as stream:
+                write_srt_from_pcm(rec, iter(lambda: stream.read(VOSK_READ_SIZE), b''), out_file)
 
-        # Wait for process to complete
-        process.wait()
+            # Wait for process to complete
+            process.wait()
+            decoded = process.returncode == 0
 
-        if process.returncode != 0:
-            stderr = process.stderr.read().decode('utf-8', errors='ignore') if process.stderr else ''
-            con.print(f"[bold yellow]WARNING:[/] ffmpeg process exited with code {process.returncode}")
-            if stderr:
-                con.print(f"[yellow]Error output: {stderr[:200]}[/]")
+            if not decoded:
+                stderr = process.stderr.read().decode('utf-8', errors='ignore') if process.stderr else ''
+                con.print(f"[bold yellow]WARNING:[/] ffmpeg process exited with code {process.returncode}")
+                if stderr:
+                    con.print(f"[yellow]Error output: {stderr[:200]}[/]")
+
+        if decoded and cached_srt:
+            try:
+                cached_srt.parent.mkdir(parents=True, exist_ok=True)
+                copy2(out_file, cached_srt)
+            except OSError as e:
+                con.print(f"[yellow]NOTE:[/] Could not cache the timecode file: {e}")
 
         con.print("[bold green]SUCCESS![/] Timecode file created\n")
 
@@ -1156,6 +1444,102 @@ def generate_timecodes(audiobook_path: Path, language: str, model_type: str) ->
     return out_file
 
 
+def write_srt_from_pcm(rec: KaldiRecognizer, blocks, out_file: Path) -> None:
+    """Transcribe blocks of PCM audio and write the results to an srt file.
+
+    Each result is written as soon as the recognizer finalizes it, instead of letting
+    ``SrtResult`` read 4 KB at a time and compose the whole file in memory.
+
+    :param rec: Recognizer with word timestamps enabled
+    :param blocks: Iterable of 16-bit mono PCM byte blocks at ``SAMPLE_RATE``
+    :param out_file: Path to the srt file to write
+    """
+    with open(out_file, 'w+', encoding='utf-8', buffering=VOSK_READ_SIZE) as fp:
+        index = 1
+        for data in blocks:
+            # A finished utterance must be collected now; vosk drops it once decoding continues.
+            # Utterances without recognized words (silence, music) are skipped without parsing
+            if rec.AcceptWaveform(data) and '"result"' in (result := rec.Result()):
+                index = write_srt_words(fp, json.loads(result), index)
+        if '"result"' in (result := rec.FinalResult()):
+            write_srt_words(fp, json.loads(result), index)
+
+
+def _av_pcm_blocks(av, audiobook_path: Path):
+    """Decode an audiobook with PyAV into 16-bit mono PCM blocks of about ``VOSK_READ_SIZE`` bytes.
+
+    :param av: The imported PyAV module
+    :param audiobook_path: Path to input audiobook file
+    :return: Generator of PCM byte blocks
+    """
+    resampler = av.AudioResampler(format='s16', layout='mono', rate=SAMPLE_RATE)
+    buffer = bytearray()
+
+    with av.open(str(audiobook_path)) as container:
+        # The trailing None flushes samples still buffered in the resampler
+        for frame in chain(container.decode(audio=0), [None]):
+            for out in resampler.resample(frame):
+                # Planes can carry alignment padding past the last sample
+                buffer += bytes(out.planes[0])[:out.samples * 2]
+            if len(buffer) >= VOSK_READ_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def write_srt_words(fp, result: dict, index: int) -> int:
+    """Write the words of one vosk result to an srt file.
+
+    Words are grouped into lines of ``SRT_WORDS_PER_LINE``, formatted like vosk's ``SrtResult``.
+
+    :param fp: Open text file to write to
+    :param result: Decoded JSON result from the recognizer
+    :param index: Index of the next subtitle entry
+    :return: Index to use for the entry after the ones written
+    """
+    words = result.get('result', [])
+
+    for i in range(0, len(words), SRT_WORDS_PER_LINE):
+        line = words[i:i + SRT_WORDS_PER_LINE]
+        fp.write(
+            f"{index}\n{_srt_timestamp(line[0]['start'])} --> {_srt_timestamp(line[-1]['end'])}\n"
+            f"{' '.join(word['word'] for word in line)}\n\n"
+        )
+        index += 1
+
+    return index
+
+
+def _srt_timestamp(seconds: float) -> str:
+    """Format seconds as an srt timestamp (HH:MM:SS,mmm).
+
+    :param seconds: Time in seconds
+    :return: Formatted timestamp
+    """
+    total_ms = round(seconds * 1_000_000) // 1000
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
+    hours_str = _PAD2[hours] if hours < 100 else str(hours)
+    return hours_str + ':' + _PAD2[minutes] + ':' + _PAD2[secs] + ',' + _PAD3[millis]
+
+
+@lru_cache(maxsize=8)
+def _marker_patterns(excluded_phrases: tuple, markers: tuple) -> tuple[re.Pattern, re.Pattern]:
+    """Compile the excluded phrases and chapter markers of a language into alternation regexes.
+
+    :param excluded_phrases: Phrases that disqualify a line
+    :param markers: Chapter marker words
+    :return: Tuple of (excluded phrases, markers) patterns
+    """
+    return (
+        re.compile('|'.join(map(re.escape, excluded_phrases))),
+        re.compile('|'.join(map(re.escape, markers)))
+    )
+
+
 def parse_timecodes(srt_content: list, language: str = 'en-us') -> list[dict]:
     """Parse the contents of the srt timecode file.
 
@@ -1180,32 +1564,32 @@ def parse_timecodes(srt_content: list, language: str = 'en-us') -> list[dict]:
         )
         sys.exit(13)
 
+    excluded_re, markers_re = _marker_patterns(excluded_phrases, markers)
     timecodes = []
     counter = 1
+    prev_dict = None
 
-    for i, line in enumerate(srt_content):
+    for line, next_line in zip(srt_content, srt_content[1:]):
         if (
-                # Not the end of the list
-                i != (len(srt_content) - 1) and
-                # Doesn't contain an excluded phrase
-                not any(x in srt_content[i+1] for x in excluded_phrases) and
                 # Contains a marker substring
-                any(m in srt_content[i+1] for m in markers)
+                markers_re.search(next_line) and
+                # Doesn't contain an excluded phrase
+                not excluded_re.search(next_line)
         ):
-            if start_regexp := re.search(r'\d\d:\d\d:\d\d,\d+(?=\s-)', line, flags=0):
+            if start_regexp := SRT_START_RE.search(line):
                 start = start_regexp.group(0).replace(',', '.')
 
                 # Prologue
-                if markers[0] in srt_content[i+1]:
+                if markers[0] in next_line:
                     chapter_type = markers[0].title()
                 # Chapter X
-                elif markers[1] in srt_content[i+1]:
+                elif markers[1] in next_line:
                     # Add leading zero for better sorting if < 10
                     chapter_count = f'{counter:02d}'
                     chapter_type = f'{markers[1].title()} {chapter_count}'
                     counter += 1
                 # Epilogue
-                elif markers[2] in srt_content[i+1]:
+                elif markers[2] in next_line:
                     chapter_type = markers[2].title()
                 else:
                     chapter_type = ''
@@ -1216,20 +1600,22 @@ def parse_timecodes(srt_content: list, language: str = 'en-us') -> list[dict]:
                 else:
                     time_dict = {'start': start, 'chapter_type': chapter_type}
                 timecodes.append(time_dict)
+
+                # End the previous chapter one second before this one starts, for overlap
+                if prev_dict:
+                    try:
+                        prev_dict['end'] = convert_time(time_dict['start'])
+                    except ValueError as e:
+                        con.print(
+                            f"[bold yellow]WARNING:[/] Failed to convert time for chapter {len(timecodes) - 1}: {e}"
+                        )
+                        # Use the start time of next chapter as-is
+                        prev_dict['end'] = time_dict['start']
+                prev_dict = time_dict
             else:
                 con.print("[bold yellow]WARNING:[/] A timecode was skipped. A Start time failed to match")
                 continue
 
-    # Add end key based on end time of next chapter minus one second for overlap
-    for i, d in enumerate(timecodes):
-        if i != len(timecodes) - 1:
-            try:
-                d['end'] = convert_time(timecodes[i+1]['start'])
-            except ValueError as e:
-                con.print(f"[bold yellow]WARNING:[/] Failed to convert time for chapter {i+1}: {e}")
-                # Use the start time of next chapter as-is
-                d['end'] = timecodes[i+1]['start']
-
     if timecodes:
         return timecodes
     else:
@@ -1248,8 +1634,12 @@ def verify_count(audiobook_path: Path, timecodes: list[dict]) -> None:
     """
     # Count files with same extension as input (excluding the original file)
     file_ext = audiobook_path.suffix.lower()
-    pattern = f'*{file_ext}'
-    file_count = sum(1 for x in audiobook_path.parent.glob(pattern) if x.stem != audiobook_path.stem)
+    source_stem = audiobook_path.stem
+    with os.scandir(audiobook_path.parent) as entries:
+        file_count = sum(
+            1 for entry in entries
+            if entry.name.endswith(file_ext) and entry.name[:-len(file_ext)] != source_stem and entry.is_file()
+        )
     expected = len(timecodes)
 
     if file_count >= expected:
@@ -1273,17 +1663,16 @@ def write_cue_file(timecodes: list[dict], cue_path: Path, audiobook_stem: str) -
     :param audiobook_stem: Stem name of the audiobook file
     :return: Boolean success/failure flag
     """
+    # Assemble the whole file first so it is written in a single call
+    parts = [f'FILE "{audiobook_stem}.mp3" MP3\n']
+    for i, time in enumerate(timecodes, start=1):
+        parts.append(f'TRACK {i} AUDIO\n  TITLE\t"{time["chapter_type"]}"\n  START\t{time["start"]}\n')
+        if i != len(timecodes):
+            parts.append(f"  END\t\t{time['end']}\n")
+
     try:
         with open(cue_path, 'x', encoding='utf-8') as fp:
-            fp.write(f'FILE "{audiobook_stem}.mp3" MP3\n')
-            for i, time in enumerate(timecodes, start=1):
-                fp.writelines([
-                    f"TRACK {i} AUDIO\n",
-                    f'  TITLE\t"{time["chapter_type"]}"\n',
-                    f"  START\t{time['start']}\n"
-                ])
-                if i != len(timecodes):
-                    fp.write(f"  END\t\t{time['end']}\n")
+            fp.write(''.join(parts))
         return True
 
     except OSError as e:
@@ -1297,6 +1686,34 @@ def write_cue_file(timecodes: list[dict], cue_path: Path, audiobook_stem: str) -
         return False
 
 
+def parse_cue_lines(lines: Iterable[str]) -> list[dict]:
+    """Parse timecodes from the lines of a cue file written by `write_cue_file`.
+
+    :param lines: Lines of the cue file, including the FILE header. Any open text file works
+    :return: List of timecodes in dictionary form, empty if no tracks were found
+    """
+    timecodes = []
+    time_dict = {}
+
+    lines = iter(lines)
+    # Skip the FILE header line
+    next(lines, None)
+
+    for line in lines:
+        # A new track completes the previous entry
+        if line.lstrip().startswith('TRACK'):
+            if time_dict:
+                timecodes.append(time_dict)
+                time_dict = {}
+        elif match := CUE_LINE_RE.match(line):
+            time_dict[CUE_FIELDS[match[1]]] = match[2] if match[2] is not None else match[3]
+
+    if time_dict:
+        timecodes.append(time_dict)
+
+    return timecodes
+
+
 def read_cue_file(cue_path: Path) -> Optional[list[dict]]:
     """Read audiobook timecodes from a cue file.
 
@@ -1306,41 +1723,13 @@ def read_cue_file(cue_path: Path) -> Optional[list[dict]]:
     :param cue_path: Path to cue file
     :return: List of timecodes in dictionary form, or None if parsing fails
     """
-    timecodes = []
-    time_dict = {}
-
     try:
         with open(cue_path, 'r', encoding='utf-8') as fp:
-            content = fp.readlines()
+            timecodes = parse_cue_lines(fp)
     except (OSError, UnicodeDecodeError) as e:
         con.print(f"[bold red]ERROR:[/] Failed to read cue file: {e}")
         return None
 
-    content = [l.strip('\n') for l in content]
-
-    for i, line in enumerate(content[1:], start=1):
-        try:
-            if 'TITLE' in line:
-                if match := re.search(r'TITLE\t"(.*)"', line):
-                    time_dict['chapter_type'] = match[1]
-            if 'START' in line:
-                if match := re.search(r'START\t(.+)', line):
-                    time_dict['start'] = match[1]
-            if 'END' in line and i < len(content):
-                if match := re.search(r'END\t+(.+)', line):
-                    time_dict['end'] = match[1]
-
-        except (ValueError, IndexError) as e:
-            con.print(f"[bold red]ERROR:[/] Failed to match line {i}: {e}. Returning...")
-            return None
-
-        # Check if we've completed a track entry
-        if i < len(content) and 'TRACK' in content[i] and time_dict:
-            timecodes.append(time_dict)
-            time_dict = {}
-        elif line == content[-1] and time_dict:
-            timecodes.append(time_dict)
-
     if timecodes:
         return timecodes
     else:
@@ -1370,7 +1759,10 @@ def main():
         sys.exit(20)
 
     # Destructure tuple
-    audiobook_file, in_metadata, lang, model_name, model_type, cue_file, ffmpeg, use_existing_chapters, detection_method, output_format = parse_args()
+    audiobook_file, in_metadata, lang, model_name, model_type, cue_file, ffmpeg, use_existing_chapters, detection_method, output_format, jobs, quiet, use_cache = parse_args()
+
+    # Rich tables and panels are only worth rendering for a person at a terminal
+    rich_output = sys.stdout.isatty() and not quiet
 
     # Check supported file formats
     supported_formats = ['.mp3', '.m4b', '.m4a']
@@ -1411,7 +1803,7 @@ def main():
                         parsed_metadata |= in_metadata
 
                 # Skip transcription, go directly to printing chapters
-                print_table(timecodes)
+                print_table(timecodes, rich_output)
                 print("\n")
 
                 # Determine whether to use existing chapters
@@ -1455,6 +1847,20 @@ def main():
     else:
         timecodes = None
 
+    # Cover art extraction doesn't depend on the metadata pass, so start it now and let it
+    # overlap with metadata extraction. It runs silently; all output stays on this thread
+    coverart_start_time = time.time()
+    if in_metadata.get('cover_art'):
+        coverart_future = None
+    else:
+        background = ThreadPoolExecutor(max_workers=1)
+        coverart_future = background.submit(extract_coverart, audiobook_file, ffmpeg)
+        background.shutdown(wait=False)
+
+    # The model download is network-bound, so it overlaps the metadata and cover art steps too;
+    # its progress is only shown once the main thread gets to the download step
+    download = start_model_download(model_name) if model_name and lang else None
+
     # Extract metadata from input file (skip if already extracted from M4B)
     if file_ext in ['.m4b', '.m4a'] and 'parsed_metadata' in locals() and parsed_metadata:
         # Already extracted from M4B
@@ -1483,17 +1889,22 @@ def main():
         parsed_metadata = in_metadata
         print("\n")
 
-    con.print(Panel(Pretty(parsed_metadata), title="ID3 Metadata"))
+    if rich_output:
+        con.print(Panel(Pretty(parsed_metadata), title="ID3 Metadata"))
     print("\n")
 
     # Search for existing cover art
     con.rule("[cyan]Discovering Cover Art[/cyan]")
     print("\n")
 
-    coverart_start_time = time.time()
-    if not parsed_metadata.get('cover_art'):
+    if coverart_future is not None:
         con.print("[magenta]Perusing for cover art in source[/magenta]...")
-        cover_art = extract_coverart(audiobook_file, ffmpeg)
+        cover_art = coverart_future.result()
+        if cover_art:
+            con.print("[bold green]SUCCESS![/] Cover art extracted")
+        else:
+            con.print("[bold yellow]WARNING:[/] Failed to extract cover art, or none was found")
+        print("\n")
     else:
         cover_art_path = parsed_metadata['cover_art']
         if isinstance(cover_art_path, Path) and cover_art_path.exists():
@@ -1507,13 +1918,11 @@ def main():
     con.print(f"[dim]⏱ Cover art: {format_elapsed_time(coverart_elapsed)}[/dim]")
     print("\n")
 
-    # Download model if option selected
-    if model_name and lang:
+    # Wait for the model download if option selected; its errors exit from here
+    if download is not None:
         con.rule(f"[cyan]Downloading '{lang} ({model_type})' Model[/cyan]")
         print("\n")
-        con.print("[magenta]Preparing download...[/magenta]")
-        print("\n")
-        download_model(model_name)
+        finish_model_download(download)
 
     # Generate timecodes from audio file (skip if already have from M4B)
     if 'timecodes' not in locals() or timecodes is None:
@@ -1521,7 +1930,7 @@ def main():
         detection_start_time = time.time()
 
         # Use smart detection to choose best method
-        timecodes = generate_timecodes_smart(audiobook_file, lang, model_type, detection_method)
+        timecodes = generate_timecodes_smart(audiobook_file, lang, model_type, detection_method, use_cache)
 
         # Calculate and display detection time
         detection_elapsed = time.time() - detection_start_time
@@ -1530,7 +1939,7 @@ def main():
 
         # Print timecodes table
         print("\n")
-        print_table(timecodes)
+        print_table(timecodes, rich_output)
         print("\n")
     else:
         # Already have timecodes from M4B
@@ -1559,7 +1968,7 @@ def main():
     # Start timing file splitting
     splitting_start_time = time.time()
 
-    split_file(audiobook_file, timecodes, parsed_metadata, cover_art, ffmpeg, output_format)
+    split_file(audiobook_file, timecodes, parsed_metadata, cover_art, ffmpeg, output_format, jobs)
 
     # Calculate and display splitting time
     splitting_elapsed = time.time() - splitting_start_time
@@ -14,19 +14,92 @@ can extract those chapters directly without ML transcription.
 
 from pathlib import Path
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import os
 import subprocess
+import sys
 import json
 import re
-from datetime import timedelta
+import tempfile
+from functools import lru_cache
+from shutil import which
+
+# orjson parses large ffprobe output much faster; its JSONDecodeError subclasses json's
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Keep ffmpeg's stderr down to actual errors, since it's only read when a command fails
+_FFMPEG_QUIET_ARGS = ('-nostats', '-loglevel', 'error')
+
+# Command line length to stay under when packing several outputs into one ffmpeg run,
+# with headroom for the environment (Windows caps command lines at 32767 characters)
+try:
+    ARG_MAX = os.sysconf('SC_ARG_MAX') // 2
+except (AttributeError, ValueError, OSError):
+    ARG_MAX = 32767 // 2
+
+# HH:MM:SS with optional .mmm, as produced by _seconds_to_timestamp()
+_TIMESTAMP_RE = re.compile(r'(\d+):(\d+):(\d+)(?:\.(\d+))?$')
+
+# Characters that aren't allowed in file names on common filesystems
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+
+@lru_cache(maxsize=None)
+def _resolve(tool: str) -> Optional[str]:
+    """
+    Look up an executable on the PATH once per process.
+
+    :param tool: Executable name or path
+    :return: Absolute path to the executable, or None if it isn't found
+    """
+    return which(tool)
 
 
 def has_ffmpeg() -> bool:
     """Check if ffmpeg is available."""
-    from shutil import which
-    return which('ffmpeg') is not None
+    return _resolve('ffmpeg') is not None
 
 
-def get_m4b_chapters(m4b_path: Path, ffmpeg: str = 'ffmpeg') -> Optional[list[dict]]:
+def _probe(m4b_path: Path) -> dict:
+    """
+    Run ffprobe once for both the container format and chapter list.
+
+    Results are cached per resolved path, modification time and size, so
+    repeated lookups of an unchanged file within one process don't spawn
+    ffprobe again, however the path was spelled.
+
+    :param m4b_path: Path to M4B file
+    :return: Parsed ffprobe JSON output
+    """
+    st = m4b_path.stat()
+    return _probe_cached(str(m4b_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=16)
+def _probe_cached(m4b_path: str, mtime_ns: int, size: int) -> dict:
+    result = subprocess.run(
+        [
+            _resolve('ffprobe') or 'ffprobe',
+            '-v', 'quiet',
+            '-print_format', 'json',
+            '-show_format',
+            '-show_chapters',
+            m4b_path
+        ],
+        capture_output=True,
+        check=True
+    )
+
+    # Both parsers take the raw bytes, so skip decoding stdout to str first
+    return _json.loads(result.stdout)
+
+
+def get_m4b_chapters(m4b_path: Path,
+                     ffmpeg: str = 'ffmpeg',
+                     probe: Optional[dict] = None) -> Optional[list[dict]]:
     """
     Extract existing chapter markers from M4B file.
 
@@ -35,6 +108,7 @@ def get_m4b_chapters(m4b_path: Path, ffmpeg: str = 'ffmpeg') -> Optional[list[di
 
     :param m4b_path: Path to M4B audiobook file
     :param ffmpeg: Path to ffmpeg executable
+    :param probe: Pre-parsed ffprobe output from `_probe()`, if already available
     :return: List of chapter dictionaries, or None if no chapters found
     """
     if not m4b_path.exists():
@@ -43,41 +117,21 @@ def get_m4b_chapters(m4b_path: Path, ffmpeg: str = 'ffmpeg') -> Optional[list[di
     print(f"[M4B] Extracting chapters from: {m4b_path.name}")
 
     try:
-        # Use ffprobe to get chapter information
-        result = subprocess.run(
-            [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_chapters',
-                str(m4b_path)
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        data = json.loads(result.stdout)
+        data = probe if probe is not None else _probe(m4b_path)
 
         if 'chapters' not in data or not data['chapters']:
             print("[M4B] No embedded chapters found")
             return None
 
-        chapters = []
-        for i, chapter in enumerate(data['chapters'], start=1):
-            # Extract chapter metadata
-            start_time = float(chapter.get('start_time', 0))
-            end_time = float(chapter.get('end_time', 0))
-
-            # Get chapter title from tags
-            tags = chapter.get('tags', {})
-            title = tags.get('title', f'Chapter {i:02d}')
-
-            chapters.append({
-                'start': _seconds_to_timestamp(start_time),
-                'end': _seconds_to_timestamp(end_time),
-                'chapter_type': title
-            })
+        # Title comes from the chapter tags, with a numbered default
+        chapters = [
+            {
+                'start': _seconds_to_timestamp(float(chapter.get('start_time', 0))),
+                'end': _seconds_to_timestamp(float(chapter.get('end_time', 0))),
+                'chapter_type': (chapter.get('tags') or {}).get('title') or f'Chapter {i:02d}'
+            }
+            for i, chapter in enumerate(data['chapters'], start=1)
+        ]
 
         print(f"[M4B] Found {len(chapters)} embedded chapters")
         return chapters
@@ -93,28 +147,16 @@ def get_m4b_chapters(m4b_path: Path, ffmpeg: str = 'ffmpeg') -> Optional[list[di
         return None
 
 
-def get_m4b_metadata(m4b_path: Path) -> dict:
+def get_m4b_metadata(m4b_path: Path, probe: Optional[dict] = None) -> dict:
     """
     Extract metadata from M4B file.
 
     :param m4b_path: Path to M4B file
+    :param probe: Pre-parsed ffprobe output from `_probe()`, if already available
     :return: Dictionary of metadata
     """
     try:
-        result = subprocess.run(
-            [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                str(m4b_path)
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        data = json.loads(result.stdout)
+        data = probe if probe is not None else _probe(m4b_path)
         format_data = data.get('format', {})
         tags = format_data.get('tags', {})
 
@@ -159,6 +201,8 @@ def convert_m4b_to_mp3(m4b_path: Path,
     :param ffmpeg: Path to ffmpeg executable
     :return: Path to converted MP3 file
     """
+    ffmpeg = _resolve(ffmpeg) or ffmpeg
+
     if output_path is None:
         output_path = m4b_path.with_suffix('.mp3')
 
@@ -168,16 +212,20 @@ def convert_m4b_to_mp3(m4b_path: Path,
     try:
         subprocess.run(
             [
-                ffmpeg,
+                ffmpeg, *_FFMPEG_QUIET_ARGS,
                 '-i', str(m4b_path),
-                '-vn',  # No video
+                '-map', '0:a:0',  # Only the audio, so cover art and data streams aren't demuxed
+                '-map_chapters', '-1',
+                '-vn', '-sn', '-dn',  # No video, subtitles or data
                 '-acodec', 'libmp3lame',
                 '-b:a', '128k',  # 128 kbps MP3
+                '-threads', '0',
                 '-y',  # Overwrite
                 str(output_path)
             ],
             check=True,
-            capture_output=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
 
         print(f"[M4B] Converted to: {output_path}")
@@ -191,7 +239,8 @@ def split_m4b_by_chapters(m4b_path: Path,
                           chapters: list[dict],
                           output_dir: Optional[Path] = None,
                           output_format: str = 'm4b',
-                          ffmpeg: str = 'ffmpeg') -> list[Path]:
+                          ffmpeg: str = 'ffmpeg',
+                          concurrency: Optional[int] = None) -> list[Path]:
     """
     Split M4B file into separate chapter files.
 
@@ -202,8 +251,11 @@ def split_m4b_by_chapters(m4b_path: Path,
     :param output_dir: Output directory (default: same as input)
     :param output_format: 'm4b' (no re-encode) or 'mp3' (re-encode)
     :param ffmpeg: Path to ffmpeg executable
+    :param concurrency: Number of ffmpeg processes to run at once (default: CPU count)
     :return: List of paths to created chapter files
     """
+    ffmpeg = _resolve(ffmpeg) or ffmpeg
+
     if output_dir is None:
         output_dir = m4b_path.parent
 
@@ -214,51 +266,237 @@ def split_m4b_by_chapters(m4b_path: Path,
 
     print(f"[M4B] Splitting into {len(chapters)} chapters ({output_format} format)")
 
+    output_ext = '.m4b' if output_format == 'm4b' else '.mp3'
+    output_names = []
     for i, chapter in enumerate(chapters, start=1):
         chapter_num = f'{i:02d}'
         chapter_title = chapter.get('chapter_type', f'Chapter {chapter_num}')
 
         # Clean title for filename
-        safe_title = re.sub(r'[<>:"/\\|?*]', '_', chapter_title)
+        safe_title = chapter_title.translate(_UNSAFE_FILENAME_CHARS)
+        output_names.append((chapter_title, output_dir / f"{file_stem} {chapter_num} - {safe_title}{output_ext}"))
+
+    if output_format == 'm4b' and is_contiguous(chapters):
+        # No re-encoding (fast!), so cut every chapter in a single ffmpeg pass with the
+        # segment muxer instead of seeking through the file once per chapter
+        with tempfile.TemporaryDirectory(dir=output_dir, prefix='.m4b_split_') as tmp_dir:
+            cut_points, first_segment = segment_cut_points(chapters)
+            if cut_points:
+                split_args = [
+                    '-f', 'segment',
+                    '-segment_times', ','.join(cut_points),
+                    '-reset_timestamps', '1',
+                    '-segment_start_number', '0',
+                    str(Path(tmp_dir, f'seg_%03d{output_ext}'))
+                ]
+            else:
+                # Single chapter, nothing to cut
+                split_args = [str(Path(tmp_dir, f'seg_000{output_ext}'))]
+
+            cmd = [ffmpeg, *_FFMPEG_QUIET_ARGS, '-i', str(m4b_path), '-map', '0:a', '-vn', '-c', 'copy', '-y', *split_args]
+
+            try:
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            except subprocess.CalledProcessError as e:
+                print(f"  ✗ Failed to split: {m4b_path.name}")
+                print(f"    Error: {e}")
+                return output_files
+
+            # Stream copy each piece to its final name, adding the chapter tags
+            jobs = []
+            for i, (chapter_title, output_file) in enumerate(output_names, start=1):
+                segment = Path(tmp_dir, f'seg_{i - 1 + first_segment:03d}{output_ext}')
+                cmd = [
+                    ffmpeg, *_FFMPEG_QUIET_ARGS, '-i', str(segment),
+                    '-map', '0', '-c', 'copy',
+                    '-metadata', f"title={chapter_title}",
+                    '-metadata', f"track={i}/{len(chapters)}",
+                    '-y', str(output_file)
+                ]
+                jobs.append((cmd, output_file))
+
+            output_files = _run_split_jobs(jobs, concurrency)
+    elif output_format == 'm4b':
+        # Gaps or overlaps between chapters can't be expressed as segment cut points,
+        # so write every chapter as a separate output of one ffmpeg run instead
+        outputs = []
+        for i, (chapter, (chapter_title, output_file)) in enumerate(zip(chapters, output_names), start=1):
+            output_args = ['-map', '0:a', '-ss', chapter['start']]
+            if 'end' in chapter:
+                duration_ms = _timestamp_to_ms(chapter['end']) - _timestamp_to_ms(chapter['start'])
+                output_args += ['-t', f'{duration_ms / 1000:.3f}']
+            output_args += [
+                '-c', 'copy',
+                '-metadata', f"title={chapter_title}",
+                '-metadata', f"track={i}/{len(chapters)}",
+                str(output_file)
+            ]
+            outputs.append((output_args, output_file))
+
+        output_files = _run_multi_output_split(
+            [ffmpeg, *_FFMPEG_QUIET_ARGS, '-y', '-i', str(m4b_path)],
+            outputs
+        )
+    else:
+        output_args = ['-vn', '-acodec', 'libmp3lame', '-b:a', '128k']  # No video
+
+        jobs = []
+        for i, (chapter, (chapter_title, output_file)) in enumerate(zip(chapters, output_names), start=1):
+            # Build ffmpeg command. Seeking before -i uses the container index instead of
+            # demuxing everything up to the chapter, and -t is then relative to that seek point
+            cmd = [ffmpeg, *_FFMPEG_QUIET_ARGS, '-ss', chapter['start'], '-i', str(m4b_path)]
+            if 'end' in chapter:
+                duration_ms = _timestamp_to_ms(chapter['end']) - _timestamp_to_ms(chapter['start'])
+                cmd += ['-t', f'{duration_ms / 1000:.3f}']
+            cmd += [
+                *output_args,
+                '-metadata', f"title={chapter_title}",
+                '-metadata', f"track={i}/{len(chapters)}",
+                '-y',
+                str(output_file)
+            ]
+
+            jobs.append((cmd, output_file))
+
+        # Re-encoding is CPU-bound in each ffmpeg process, so run chapters side by side
+        output_files = _run_split_jobs(jobs, concurrency)
 
-        if output_format == 'm4b':
-            output_file = output_dir / f"{file_stem} {chapter_num} - {safe_title}.m4b"
-            codec_args = ['-c', 'copy']  # No re-encoding (fast!)
-        else:
-            output_file = output_dir / f"{file_stem} {chapter_num} - {safe_title}.mp3"
-            codec_args = ['-acodec', 'libmp3lame', '-b:a', '128k']
-
-        # Build ffmpeg command
-        cmd = [
-            ffmpeg,
-            '-i', str(m4b_path),
-            '-ss', chapter['start']
-        ]
+    print(f"[M4B] Created {len(output_files)} chapter files")
+    return output_files
+
+
+def _run_split_job(cmd: list[str], output_file: Path) -> Optional[Path]:
+    """
+    Run one ffmpeg command that writes a chapter file.
+
+    :param cmd: ffmpeg command line
+    :param output_file: Chapter file written by the command
+    :return: Path to the chapter file, or None if ffmpeg failed
+    """
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        print(f"  ✓ Created: {output_file.name}")
+        return output_file
+    except subprocess.CalledProcessError as e:
+        print(f"  ✗ Failed to create: {output_file.name}\n    Error: {e}")
+        return None
+
+
+def _run_split_jobs(jobs: list[tuple[list[str], Path]], concurrency: Optional[int] = None) -> list[Path]:
+    """
+    Run chapter ffmpeg commands in parallel.
+
+    Threads are enough here since the work happens in the ffmpeg processes.
+
+    :param jobs: (command, output file) pairs
+    :param concurrency: Maximum number of ffmpeg processes at once (default: CPU count)
+    :return: Paths of the chapter files that were created, in job order
+    """
+    if not jobs:
+        return []
+
+    workers = min(concurrency or os.cpu_count() or 1, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda job: _run_split_job(*job), jobs))
+
+    return [path for path in results if path is not None]
 
-        if 'end' in chapter:
-            cmd.extend(['-to', chapter['end']])
 
-        cmd.extend([
-            '-vn',  # No video
-            *codec_args,
-            '-metadata', f"title={chapter_title}",
-            '-metadata', f"track={i}/{len(chapters)}",
-            '-y',
-            str(output_file)
-        ])
+def _run_multi_output_split(input_cmd: list[str], outputs: list[tuple[list[str], Path]]) -> list[Path]:
+    """
+    Write several chapter files from one ffmpeg process, so the source is only opened once.
+
+    Outputs are grouped into as few commands as the OS command line length allows.
 
+    :param input_cmd: ffmpeg executable, global options and input
+    :param outputs: (output options ending in the file name, output file) pairs
+    :return: Paths of the chapter files that were created
+    """
+    output_files = []
+    for group in pack_outputs(input_cmd, outputs):
+        cmd = [*input_cmd, *(arg for output_args, _ in group for arg in output_args)]
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
-            output_files.append(output_file)
-            print(f"  ✓ Created: {output_file.name}")
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         except subprocess.CalledProcessError as e:
-            print(f"  ✗ Failed to create: {output_file.name}")
+            print(f"  ✗ Failed to create: {', '.join(output_file.name for _, output_file in group)}")
             print(f"    Error: {e}")
+            continue
+
+        for _, output_file in group:
+            output_files.append(output_file)
+            print(f"  ✓ Created: {output_file.name}")
 
-    print(f"[M4B] Created {len(output_files)} chapter files")
     return output_files
 
 
+def pack_outputs(input_cmd: list[str], outputs: list[tuple[list[str], Path]]) -> list[list[tuple[list[str], Path]]]:
+    """
+    Group ffmpeg outputs so each group fits in one command line after the shared input.
+
+    Shared with chapterize_ab.py, which packs its chapter cuts the same way.
+
+    :param input_cmd: ffmpeg executable, global options and input
+    :param outputs: (output options ending in the file name, output file) pairs
+    :return: The outputs in order, split into groups of at most ``ARG_MAX`` characters per command
+    """
+    budget = ARG_MAX - sum(len(arg) + 1 for arg in input_cmd)
+    groups = []
+    used = budget
+    for output_args, output_file in outputs:
+        size = sum(len(arg) + 1 for arg in output_args)
+        if used + size > budget:
+            groups.append([])
+            used = 0
+        groups[-1].append((output_args, output_file))
+        used += size
+
+    return groups
+
+
+def is_contiguous(chapters: list[dict]) -> bool:
+    """
+    Check whether the chapters can be split at shared boundaries with the segment muxer.
+
+    That requires well-formed start markers in increasing order, with each end marker
+    (if any) equal to the next chapter's start.
+
+    :param chapters: List of chapter dictionaries with start/end times
+    :return: True if cutting at each start marker gives exactly the marked chapters
+    """
+    try:
+        starts = [_timestamp_to_ms(chapter.get('start', '00:00:00.000')) for chapter in chapters]
+        ends = [_timestamp_to_ms(chapter['end']) if 'end' in chapter else None for chapter in chapters]
+    except ValueError:
+        return False
+
+    if not starts or any(a >= b for a, b in zip(starts, starts[1:])):
+        return False
+
+    return all(end is None or end == next_start for end, next_start in zip(ends, starts[1:]))
+
+
+def segment_cut_points(chapters: list[dict]) -> tuple[list[str], int]:
+    """
+    Build the ``-segment_times`` list for splitting all chapters in one ffmpeg pass.
+
+    Chapters are cut at each start marker, so check them with `is_contiguous()` first.
+    Audio before the first chapter or after an explicit final end marker is split off
+    into its own segment and skipped.
+
+    :param chapters: List of chapter dictionaries with start/end times
+    :return: Cut points in ffmpeg time syntax, and the index of the first chapter's segment
+    """
+    first_start = chapters[0].get('start', '00:00:00.000') if chapters else '00:00:00.000'
+    has_lead_in = _timestamp_to_ms(first_start) > 0
+
+    cut_points = [first_start] if has_lead_in else []
+    cut_points.extend(chapter['start'] for chapter in chapters[1:])
+    if chapters and 'end' in chapters[-1]:
+        cut_points.append(chapters[-1]['end'])
+
+    return cut_points, int(has_lead_in)
+
+
 def create_m4b_with_chapters(input_audio: Path,
                              chapters: list[dict],
                              output_path: Path,
@@ -277,80 +515,74 @@ def create_m4b_with_chapters(input_audio: Path,
     :param ffmpeg: Path to ffmpeg executable
     :return: Path to created M4B file
     """
+    ffmpeg = _resolve(ffmpeg) or ffmpeg
+
     print(f"[M4B] Creating M4B with embedded chapters: {output_path.name}")
 
-    # Create metadata file for chapters
-    metadata_content = ";FFMETADATA1\n"
+    # Build the ffmetadata document for the chapters
+    parts = [";FFMETADATA1\n"]
 
     # Add global metadata
     if metadata:
-        for key, value in metadata.items():
-            metadata_content += f"{key}={value}\n"
+        parts.extend(f"{key}={value}\n" for key, value in metadata.items())
 
     # Add chapter markers
     for chapter in chapters:
         start_ms = _timestamp_to_ms(chapter['start'])
         end_ms = _timestamp_to_ms(chapter.get('end', chapter['start']))
 
-        metadata_content += f"""
+        parts.append(f"""
 [CHAPTER]
 TIMEBASE=1/1000
 START={start_ms}
 END={end_ms}
 title={chapter.get('chapter_type', 'Chapter')}
-"""
+""")
 
-    # Write metadata to temporary file
-    metadata_file = output_path.parent / 'ffmetadata.txt'
-    try:
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            f.write(metadata_content)
-
-        # Create M4B with chapters
-        cmd = [
-            ffmpeg,
-            '-i', str(input_audio),
-            '-i', str(metadata_file),
-            '-map_metadata', '1',
-            '-c', 'copy',
-            '-y',
-            str(output_path)
-        ]
+    metadata_content = ''.join(parts).encode('utf-8')
 
-        subprocess.run(cmd, check=True, capture_output=True)
-        print(f"[M4B] Created: {output_path}")
+    # Create M4B with chapters, feeding the metadata through stdin instead of a temporary file
+    cmd = [
+        ffmpeg, *_FFMPEG_QUIET_ARGS,
+        '-i', str(input_audio),
+        '-f', 'ffmetadata', '-i', 'pipe:0',
+        '-map_metadata', '1',
+        '-c', 'copy',
+        '-y',
+        str(output_path)
+    ]
 
-        return output_path
+    subprocess.run(cmd, input=metadata_content, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    print(f"[M4B] Created: {output_path}")
 
-    finally:
-        # Clean up metadata file
-        if metadata_file.exists():
-            metadata_file.unlink()
+    return output_path
 
 
 # Utility functions
 
 def _seconds_to_timestamp(seconds: float) -> str:
     """Convert seconds to HH:MM:SS.mmm format."""
-    td = timedelta(seconds=seconds)
-    hours = int(td.total_seconds() // 3600)
-    minutes = int((td.total_seconds() % 3600) // 60)
-    secs = int(td.total_seconds() % 60)
-    ms = int((td.total_seconds() % 1) * 1000)
+    total_ms = int(seconds * 1000 + 0.5)
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, ms = divmod(rem, 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:03d}"
 
 
+@lru_cache(maxsize=4096)
 def _timestamp_to_ms(timestamp: str) -> int:
-    """Convert HH:MM:SS.mmm timestamp to milliseconds."""
-    parts = timestamp.split(':')
-    hours = int(parts[0])
-    minutes = int(parts[1])
-    secs_parts = parts[2].split('.')
-    seconds = int(secs_parts[0])
-    ms = int(secs_parts[1]) if len(secs_parts) > 1 else 0
+    """
+    Convert HH:MM:SS.mmm timestamp to milliseconds.
+
+    Cached, since each boundary is usually both one chapter's end and the next one's start,
+    and the split and metadata paths parse the same markers several times.
+    """
+    if not (match := _TIMESTAMP_RE.match(timestamp)):
+        raise ValueError(f"Invalid timestamp: {timestamp!r}")
 
-    total_ms = (hours * 3600 + minutes * 60 + seconds) * 1000 + ms
-    return total_ms
+    hours, minutes, seconds, ms = match.groups(default='0')
+    return (int(hours) * 3600 + int(minutes) * 60 + int(seconds)) * 1000 + int(ms)
 
 
 # CLI interface
@@ -388,6 +620,12 @@ def main():
         type=Path,
         help='Output MP3 file path'
     )
+    convert_parser.add_argument(
+        '--split-if-chaptered',
+        action='store_true',
+        help='If the file has embedded chapters, split it into M4B chapter files '
+             '(no re-encoding) instead of converting it'
+    )
 
     # Split command
     split_parser = subparsers.add_parser(
@@ -406,6 +644,13 @@ def main():
         type=Path,
         help='Output directory (default: same as input)'
     )
+    split_parser.add_argument(
+        '--concurrency', '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of chapters to process at once (default: CPU count)'
+    )
 
     # Info command
     info_parser = subparsers.add_parser(
@@ -440,7 +685,6 @@ def main():
         chapters = get_m4b_chapters(args.m4b_file)
         if chapters:
             if args.output:
-                import json
                 with open(args.output, 'w') as f:
                     json.dump(chapters, f, indent=2)
                 print(f"Chapters saved to: {args.output}")
@@ -453,7 +697,17 @@ def main():
             return 1
 
     elif args.command == 'convert':
-        convert_m4b_to_mp3(args.m4b_file, args.output)
+        chapters = get_m4b_chapters(args.m4b_file) if args.split_if_chaptered else None
+        if chapters:
+            # Stream copy splitting is far faster than re-encoding the whole book
+            split_m4b_by_chapters(
+                args.m4b_file,
+                chapters,
+                output_dir=args.output.parent if args.output else None,
+                output_format='m4b'
+            )
+        else:
+            convert_m4b_to_mp3(args.m4b_file, args.output)
 
     elif args.command == 'split':
         chapters = get_m4b_chapters(args.m4b_file)
@@ -465,21 +719,29 @@ def main():
             args.m4b_file,
             chapters,
             output_dir=args.output_dir,
-            output_format=args.format
+            output_format=args.format,
+            concurrency=args.concurrency
         )
 
     elif args.command == 'info':
         print(f"\n=== M4B File Info: {args.m4b_file.name} ===\n")
 
+        # One ffprobe run covers both metadata and chapters
+        try:
+            probe = _probe(args.m4b_file)
+        except (subprocess.CalledProcessError, json.JSONDecodeError, FileNotFoundError) as e:
+            print(f"[M4B] Could not probe file: {e}")
+            return 1
+
         # Get metadata
-        metadata = get_m4b_metadata(args.m4b_file)
+        metadata = get_m4b_metadata(args.m4b_file, probe)
         if metadata:
             print("Metadata:")
             for key, value in metadata.items():
                 print(f"  {key}: {value}")
 
         # Get chapters
-        chapters = get_m4b_chapters(args.m4b_file)
+        chapters = get_m4b_chapters(args.m4b_file, probe=probe)
         if chapters:
             print(f"\nChapters: {len(chapters)}")
             for i, chapter in enumerate(chapters[:10], 1):  # Show first 10
@@ -493,5 +755,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
@@ -5,15 +5,9 @@ Unit tests for chapterize_ab.py
 Run with: python -m pytest test_chapterize_ab.py -v
 """
 
+import io
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open, MagicMock
-import sys
-import tempfile
-import shutil
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
 
 from chapterize_ab import (
     Config,
@@ -22,11 +16,40 @@ from chapterize_ab import (
     verify_download,
     parse_config,
     convert_time,
+    _chapter_cut_commands,
     parse_timecodes,
+    write_srt_words,
+    audio_fingerprint,
+    srt_cache_dir,
     write_cue_file,
+    parse_cue_lines,
     read_cue_file,
 )
-from model.models import model_languages
+from m4b_support import is_contiguous, segment_cut_points
+
+# Built once at import; write_cue_file only reads its input, so tests can pass these directly
+SAMPLE_TIMECODES = (
+    {'start': '00:00:00.000', 'chapter_type': 'Chapter 01', 'end': '00:05:00.000'},
+    {'start': '00:05:01.000', 'chapter_type': 'Chapter 02'},
+)
+
+
+@pytest.fixture(scope="session")
+def canonical_timecodes():
+    """The chapter list written to `canonical_cue`; the last chapter has no end marker."""
+    return [
+        {'start': '00:00:00.000', 'chapter_type': 'Prologue', 'end': '00:05:00.000'},
+        {'start': '00:05:01.000', 'chapter_type': 'Chapter 01', 'end': '00:15:00.000'},
+        {'start': '00:15:01.000', 'chapter_type': 'Chapter 02'},
+    ]
+
+
+@pytest.fixture(scope="session")
+def canonical_cue(tmp_path_factory, canonical_timecodes):
+    """Write the canonical cue file once for every test that only reads it."""
+    cue_path = tmp_path_factory.mktemp("cue") / "canonical.cue"
+    assert write_cue_file(canonical_timecodes, cue_path, "test_book") is True
+    return cue_path
 
 
 class TestConfig:
@@ -40,26 +63,20 @@ class TestConfig:
         assert config.ffmpeg_path == 'ffmpeg'
         assert config.generate_cue_file is False
         assert config.cue_path == ''
+        assert config.cache_transcripts is True
 
-    def test_config_validate_valid(self):
-        """Test validation with valid config."""
-        config = Config()
-        errors = config.validate()
-        assert errors == []
-
-    def test_config_validate_invalid_model(self):
-        """Test validation catches invalid model size."""
-        config = Config(default_model='invalid')
-        errors = config.validate()
-        assert len(errors) > 0
-        assert any('model size' in err for err in errors)
+    def test_config_validate(self):
+        """Test validation accepts the defaults."""
+        assert Config().validate() == []
 
-    def test_config_validate_invalid_language(self):
-        """Test validation catches invalid language."""
-        config = Config(default_language='invalid-lang')
-        errors = config.validate()
-        assert len(errors) > 0
-        assert any('language' in err.lower() for err in errors)
+    @pytest.mark.parametrize("overrides, expected", [
+        pytest.param({'default_model': 'invalid'}, 'model size', id="invalid_model"),
+        pytest.param({'default_language': 'invalid-lang'}, 'language', id="invalid_language"),
+    ])
+    def test_config_validate_rejected(self, overrides, expected):
+        """Test validation catches invalid model sizes and languages."""
+        errors = Config(**overrides).validate()
+        assert expected in ' '.join(errors).lower()
 
 
 class TestPathExists:
@@ -90,30 +107,23 @@ class TestPathExists:
 class TestVerifyLanguage:
     """Test language verification function."""
 
-    def test_verify_language_code(self):
-        """Test with valid language code."""
-        result = verify_language('en-us')
-        assert result == 'en-us'
-
-    def test_verify_language_name(self):
-        """Test with valid language name."""
-        result = verify_language('English')
-        assert result == 'en-us'
-
-    def test_verify_language_case_insensitive(self):
-        """Test that language checking is case-insensitive."""
-        result = verify_language('french')
-        assert result == 'fr'
-
-    def test_verify_language_empty(self):
-        """Test with empty language string."""
+    @pytest.mark.parametrize("language, expected", [
+        pytest.param('en-us', 'en-us', id="code"),
+        pytest.param('English', 'en-us', id="name"),
+        pytest.param('french', 'fr', id="case_insensitive"),
+    ])
+    def test_verify_language(self, language, expected):
+        """Test with valid language codes and names."""
+        assert verify_language(language) == expected
+
+    @pytest.mark.parametrize("language", [
+        pytest.param('', id="empty"),
+        pytest.param('invalid-language', id="invalid"),
+    ])
+    def test_verify_language_rejected(self, language):
+        """Test with empty or unknown languages."""
         with pytest.raises(SystemExit):
-            verify_language('')
-
-    def test_verify_language_invalid(self):
-        """Test with invalid language."""
-        with pytest.raises(SystemExit):
-            verify_language('invalid-language')
+            verify_language(language)
 
 
 class TestVerifyDownload:
@@ -142,35 +152,150 @@ class TestVerifyDownload:
 class TestConvertTime:
     """Test time conversion function."""
 
-    def test_convert_time_normal(self):
-        """Test normal time conversion."""
-        result = convert_time('00:01:30.500')
-        assert result == '00:01:29.500'
+    @pytest.mark.parametrize("timestamp, expected", [
+        pytest.param('00:01:30.500', '00:01:29.500', id="normal"),
+        pytest.param('00:01:00.000', '00:00:59.000', id="rollover_minute"),
+        pytest.param('01:00:00.000', '00:59:59.000', id="rollover_hour"),
+        pytest.param('00:00:00.000', '00:00:00.000', id="zero"),  # Should handle gracefully
+    ])
+    def test_convert_time(self, timestamp, expected):
+        """Test conversion to one second before the marker."""
+        assert convert_time(timestamp) == expected
+
+    @pytest.mark.parametrize("timestamp", [
+        pytest.param('invalid', id="invalid_format"),
+        pytest.param('00:01:30', id="missing_milliseconds"),
+    ])
+    def test_convert_time_invalid(self, timestamp):
+        """Test with malformed time strings."""
+        with pytest.raises(ValueError):
+            convert_time(timestamp)
 
-    def test_convert_time_rollover_minute(self):
-        """Test rollover from seconds to minutes."""
-        result = convert_time('00:01:00.000')
-        assert result == '00:00:59.000'
 
-    def test_convert_time_rollover_hour(self):
-        """Test rollover from minutes to hours."""
-        result = convert_time('01:00:00.000')
-        assert result == '00:59:59.000'
+class TestSegmentCutPoints:
+    """Test the cut list used to split every chapter in one ffmpeg pass."""
 
-    def test_convert_time_zero(self):
-        """Test with zero time."""
-        result = convert_time('00:00:00.000')
-        assert result == '00:00:00.000'  # Should handle gracefully
+    def test_cut_points_from_chapter_starts(self):
+        """Chapters are cut at each start after the first."""
+        timecodes = [
+            {'start': '00:00:00.000', 'end': '00:09:59.000', 'chapter_type': 'Chapter 01'},
+            {'start': '00:10:00.000', 'end': '00:19:59.000', 'chapter_type': 'Chapter 02'},
+            {'start': '00:20:00.000', 'chapter_type': 'Chapter 03'},
+        ]
+        assert segment_cut_points(timecodes) == (['00:10:00.000', '00:20:00.000'], 0)
 
-    def test_convert_time_invalid_format(self):
-        """Test with invalid time format."""
-        with pytest.raises(ValueError):
-            convert_time('invalid')
+    def test_cut_points_skip_lead_in_and_tail(self):
+        """Audio before the first chapter and after the last end gets its own segment."""
+        timecodes = [
+            {'start': '00:00:05.000', 'chapter_type': 'Prologue'},
+            {'start': '00:10:00.000', 'end': '00:20:00.000', 'chapter_type': 'Chapter 01'},
+        ]
+        cut_points, first_segment = segment_cut_points(timecodes)
+        assert cut_points == ['00:00:05.000', '00:10:00.000', '00:20:00.000']
+        assert first_segment == 1
+
+
+class TestIsContiguous:
+    """Test the check that decides whether chapters can be cut with the segment muxer."""
+
+    def test_gap_between_chapters_is_not_contiguous(self):
+        """A gap before the next start can't be cut with the segment muxer."""
+        timecodes = [
+            {'start': '00:00:00.000', 'end': '00:09:00.000', 'chapter_type': 'Chapter 01'},
+            {'start': '00:10:00.000', 'chapter_type': 'Chapter 02'},
+        ]
+        assert is_contiguous(timecodes) is False
+        assert is_contiguous([{**timecodes[0], 'end': '00:10:00.000'}, timecodes[1]]) is True
+
+    def test_unsorted_starts_are_not_contiguous(self):
+        """Out-of-order start markers would give an invalid -segment_times list."""
+        timecodes = [
+            {'start': '00:10:00.000', 'chapter_type': 'Chapter 02'},
+            {'start': '00:00:00.000', 'chapter_type': 'Chapter 01'},
+        ]
+        assert is_contiguous(timecodes) is False
 
-    def test_convert_time_missing_milliseconds(self):
-        """Test with missing milliseconds."""
-        with pytest.raises(ValueError):
-            convert_time('00:01:30')
+
+class TestChapterCutCommands:
+    """Test the per-chapter cuts used when chapters aren't contiguous."""
+
+    def test_chapter_cut_commands_honour_end_markers(self):
+        """Chapters with gaps are trimmed to their own start and end markers."""
+        timecodes = [
+            {'start': '00:00:00.000', 'end': '00:09:00.000', 'chapter_type': 'Chapter 01'},
+            {'start': '00:10:00.000', 'chapter_type': 'Chapter 02'},
+        ]
+        commands = _chapter_cut_commands(['ffmpeg', '-i', 'book.mp3'], timecodes,
+                                         ['-c:a', 'copy'], Path('tmp/chap_%03d.mp3'))
+        assert commands == [[
+            'ffmpeg', '-i', 'book.mp3',
+            '-map', '0:a', '-map_chapters', '-1', '-ss', '00:00:00.000', '-to', '00:09:00.000',
+            '-c:a', 'copy', str(Path('tmp/chap_000.mp3')),
+            '-map', '0:a', '-map_chapters', '-1', '-ss', '00:10:00.000',
+            '-c:a', 'copy', str(Path('tmp/chap_001.mp3')),
+        ]]
+
+
+class TestWriteSrtWords:
+    """Test srt output written from vosk recognizer results."""
+
+    def test_write_srt_words_lines(self):
+        """Words are grouped into numbered, timestamped lines."""
+        words = [{'word': f'w{i}', 'start': i + 0.5, 'end': i + 0.9} for i in range(9)]
+        buf = io.StringIO()
+        next_index = write_srt_words(buf, {'result': words}, 1)
+        assert next_index == 3
+        assert buf.getvalue() == (
+            "1\n00:00:00,500 --> 00:00:06,900\nw0 w1 w2 w3 w4 w5 w6\n\n"
+            "2\n00:00:07,500 --> 00:00:08,900\nw7 w8\n\n"
+        )
+
+    def test_write_srt_words_parses(self):
+        """Generated srt content is readable by parse_timecodes."""
+        buf = io.StringIO()
+        index = write_srt_words(buf, {'text': ''}, 1)
+        index = write_srt_words(buf, {'result': [{'word': 'prologue', 'start': 1.0, 'end': 1.5}]}, index)
+        write_srt_words(buf, {'result': [{'word': 'chapter', 'start': 3723.25, 'end': 3723.75},
+                                         {'word': 'one', 'start': 3723.8, 'end': 3724.0}]}, index)
+        result = parse_timecodes(buf.getvalue().splitlines(), 'en-us')
+        assert [t['chapter_type'] for t in result] == ['Prologue', 'Chapter 01']
+        assert result[1]['start'] == '01:02:03.250'
+
+
+class TestAudioFingerprint:
+    """Test the content fingerprint used to cache transcriptions."""
+
+    def test_fingerprint_ignores_file_name(self, tmp_path):
+        """A renamed copy of the same audio has the same fingerprint."""
+        original = tmp_path / "book.mp3"
+        original.write_bytes(bytes(range(256)) * 100)
+        copy = tmp_path / "renamed.mp3"
+        copy.write_bytes(original.read_bytes())
+        assert audio_fingerprint(original, 'en-us') == audio_fingerprint(copy, 'en-us')
+
+    def test_fingerprint_changes_with_content_and_options(self, tmp_path):
+        """Different audio or transcription options give different fingerprints."""
+        first = tmp_path / "first.mp3"
+        first.write_bytes(b'a' * 1000)
+        second = tmp_path / "second.mp3"
+        second.write_bytes(b'a' * 999 + b'b')
+        assert audio_fingerprint(first) != audio_fingerprint(second)
+        assert audio_fingerprint(first, 'en-us', 'small') != audio_fingerprint(first, 'en-us', 'large')
+
+
+class TestSrtCacheDir:
+    """Test where cached transcriptions are stored."""
+
+    def test_srt_cache_dir_honours_xdg_cache_home(self, tmp_path, monkeypatch):
+        """XDG_CACHE_HOME is read when the directory is needed, not at import."""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        assert srt_cache_dir() == tmp_path / 'chapterize'
+
+    def test_srt_cache_dir_defaults_to_home(self, tmp_path, monkeypatch):
+        """Without XDG_CACHE_HOME the cache lives under ~/.cache."""
+        monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+        monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+        assert srt_cache_dir() == tmp_path / '.cache' / 'chapterize'
 
 
 class TestParseTimecodes:
@@ -250,17 +375,15 @@ class TestParseTimecodes:
         assert exc_info.value.code == 13
 
 
+@pytest.mark.xdist_group("cue_io")
 class TestCueFileOperations:
     """Test cue file reading and writing."""
 
-    def test_write_cue_file_success(self, tmp_path):
+    def test_write_cue_file_success(self, fs):
         """Test successful cue file writing."""
-        cue_path = tmp_path / "test.cue"
-        timecodes = [
-            {'start': '00:00:00.000', 'chapter_type': 'Chapter 01', 'end': '00:05:00.000'},
-            {'start': '00:05:01.000', 'chapter_type': 'Chapter 02'}
-        ]
-        result = write_cue_file(timecodes, cue_path, "test_audiobook")
+        fs.create_dir("/work")
+        cue_path = Path("/work/test.cue")
+        result = write_cue_file(SAMPLE_TIMECODES, cue_path, "test_audiobook")
         assert result is True
         assert cue_path.exists()
 
@@ -270,88 +393,65 @@ class TestCueFileOperations:
         assert 'Chapter 01' in content
         assert 'Chapter 02' in content
 
-    def test_write_cue_file_io_error(self, tmp_path):
+    def test_write_cue_file_io_error(self, fs):
         """Test cue file writing with IO error."""
         # Try to write to a directory instead of a file
-        cue_path = tmp_path / "subdir"
-        cue_path.mkdir()
-        timecodes = [{'start': '00:00:00.000', 'chapter_type': 'Chapter 01'}]
-
+        fs.create_dir("/work/subdir")
         # Create a file first so 'x' mode will fail
-        cue_file = tmp_path / "test.cue"
-        cue_file.write_text("existing")
+        cue_file = Path(fs.create_file("/work/test.cue", contents="existing").path)
 
-        result = write_cue_file(timecodes, cue_file, "test")
+        result = write_cue_file(SAMPLE_TIMECODES[:1], cue_file, "test")
         assert result is False
 
-    def test_read_cue_file_success(self, tmp_path):
+    def test_read_cue_file_success(self, canonical_cue, canonical_timecodes):
         """Test successful cue file reading."""
-        cue_path = tmp_path / "test.cue"
-        cue_content = '''FILE "test.mp3" MP3
-TRACK 1 AUDIO
-  TITLE\t"Chapter 01"
-  START\t00:00:00.000
-  END\t\t00:05:00.000
-TRACK 2 AUDIO
-  TITLE\t"Chapter 02"
-  START\t00:05:01.000
-'''
-        cue_path.write_text(cue_content)
-        result = read_cue_file(cue_path)
+        result = read_cue_file(canonical_cue)
 
         assert result is not None
-        assert len(result) == 2
-        assert result[0]['chapter_type'] == 'Chapter 01'
-        assert result[0]['start'] == '00:00:00.000'
-        assert result[0]['end'] == '00:05:00.000'
-        assert result[1]['chapter_type'] == 'Chapter 02'
+        assert result == canonical_timecodes
+
+    def test_parse_cue_lines(self):
+        """Test parsing hand-written cue content without touching the filesystem."""
+        cue_content = io.StringIO(
+            'FILE "test.mp3" MP3\n'
+            'TRACK 1 AUDIO\n'
+            '  TITLE\t"Chapter 01"\n'
+            '  START\t00:00:00.000\n'
+            '  END\t\t00:05:00.000\n'
+            'TRACK 2 AUDIO\n'
+            '  TITLE\t"Chapter 02"\n'
+            '  START\t00:05:01.000\n'
+        )
+        assert parse_cue_lines(cue_content) == [
+            {'chapter_type': 'Chapter 01', 'start': '00:00:00.000', 'end': '00:05:00.000'},
+            {'chapter_type': 'Chapter 02', 'start': '00:05:01.000'},
+        ]
 
-    def test_read_cue_file_not_found(self, tmp_path):
+    def test_read_cue_file_not_found(self, fs):
         """Test reading non-existent cue file."""
-        cue_path = tmp_path / "nonexistent.cue"
+        cue_path = Path("/work/nonexistent.cue")
         result = read_cue_file(cue_path)
         assert result is None
 
-    def test_read_cue_file_empty(self, tmp_path):
+    def test_read_cue_file_empty(self, fs):
         """Test reading empty cue file."""
-        cue_path = tmp_path / "empty.cue"
-        cue_path.write_text("FILE \"test.mp3\" MP3\n")
+        cue_path = Path(fs.create_file("/work/empty.cue", contents="FILE \"test.mp3\" MP3\n").path)
         result = read_cue_file(cue_path)
         assert result is None  # Should return None for no timecodes
 
-    def test_write_read_cue_file_roundtrip(self, tmp_path):
+    def test_write_read_cue_file_roundtrip(self, canonical_cue, canonical_timecodes):
         """Test that writing and reading cue files produces consistent results."""
-        cue_path = tmp_path / "roundtrip.cue"
-        original_timecodes = [
-            {'start': '00:00:00.000', 'chapter_type': 'Prologue', 'end': '00:02:30.000'},
-            {'start': '00:02:31.000', 'chapter_type': 'Chapter 01', 'end': '00:10:00.000'},
-            {'start': '00:10:01.000', 'chapter_type': 'Chapter 02'}
-        ]
-
-        # Write
-        write_result = write_cue_file(original_timecodes, cue_path, "test")
-        assert write_result is True
-
-        # Read
-        read_timecodes = read_cue_file(cue_path)
-        assert read_timecodes is not None
-        assert len(read_timecodes) == len(original_timecodes)
+        read_timecodes = read_cue_file(canonical_cue)
 
-        # Compare (note: last entry won't have 'end' key)
-        for i, (orig, read) in enumerate(zip(original_timecodes, read_timecodes)):
-            assert read['chapter_type'] == orig['chapter_type']
-            assert read['start'] == orig['start']
-            if i < len(original_timecodes) - 1:
-                assert read['end'] == orig['end']
+        # The last chapter has no 'end' key on either side
+        assert read_timecodes == canonical_timecodes
 
 
 class TestParseConfig:
     """Test configuration file parsing."""
 
-    def test_parse_config_with_tomli(self, tmp_path, monkeypatch):
+    def test_parse_config_with_tomli(self, fs, monkeypatch):
         """Test config parsing with tomli library."""
-        # Change to temp directory
-        monkeypatch.chdir(tmp_path)
 
         # Create a test TOML config
         config_content = """
@@ -361,7 +461,8 @@ ffmpeg_path = '/usr/bin/ffmpeg'
 generate_cue_file = true
 cue_path = '/path/to/cue'
 """
-        (tmp_path / "defaults.toml").write_text(config_content)
+        fs.create_file("/work/defaults.toml", contents=config_content)
+        monkeypatch.chdir("/work")
 
         config = parse_config()
         assert config.default_language == 'en-us'
@@ -370,9 +471,10 @@ cue_path = '/path/to/cue'
         assert config.generate_cue_file is True
         assert config.cue_path == '/path/to/cue'
 
-    def test_parse_config_missing_file(self, tmp_path, monkeypatch):
+    def test_parse_config_missing_file(self, fs, monkeypatch):
         """Test config parsing when file doesn't exist."""
-        monkeypatch.chdir(tmp_path)
+        fs.create_dir("/empty")
+        monkeypatch.chdir("/empty")
         config = parse_config()
         # Should return default Config
         assert config.default_language == 'en-us'
@@ -380,6 +482,7 @@ cue_path = '/path/to/cue'
 
 
 # Integration-style tests
+@pytest.mark.xdist_group("cue_io")
 class TestIntegration:
     """Integration tests for multiple components working together."""
 
@@ -415,32 +518,18 @@ class TestIntegration:
                 assert tc['end'].count(':') == 2
                 assert '.' in tc['end']
 
-    def test_cue_file_workflow(self, tmp_path):
+    def test_cue_file_workflow(self, canonical_cue):
         """Test complete cue file workflow."""
-        cue_path = tmp_path / "workflow.cue"
-        audiobook_stem = "test_book"
-
-        # Create timecodes
-        timecodes = [
-            {'start': '00:00:00.000', 'chapter_type': 'Prologue', 'end': '00:05:00.000'},
-            {'start': '00:05:01.000', 'chapter_type': 'Chapter 01', 'end': '00:15:00.000'},
-            {'start': '00:15:01.000', 'chapter_type': 'Chapter 02'}
-        ]
-
-        # Write cue file
-        success = write_cue_file(timecodes, cue_path, audiobook_stem)
-        assert success is True
-        assert cue_path.exists()
+        assert canonical_cue.exists()
+        assert 'FILE "test_book.mp3" MP3' in canonical_cue.read_text()
 
         # Read it back
-        read_back = read_cue_file(cue_path)
+        read_back = read_cue_file(canonical_cue)
         assert read_back is not None
         assert len(read_back) == 3
 
         # Verify integrity
-        assert read_back[0]['chapter_type'] == 'Prologue'
-        assert read_back[1]['chapter_type'] == 'Chapter 01'
-        assert read_back[2]['chapter_type'] == 'Chapter 02'
+        assert [r['chapter_type'] for r in read_back] == ['Prologue', 'Chapter 01', 'Chapter 02']
 
 
 if __name__ == '__main__':